@@ -1,32 +1,112 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Request, render_template, request, jsonify, send_from_directory, Response, url_for
 import os
+import json
 from werkzeug.utils import secure_filename
 from modules.resume_analyzer import ResumeAnalyzer
 from modules.cover_letter import CoverLetterGenerator
 from modules.interview import InterviewSystem
 from modules.career_recommender import CareerRecommender
+from modules.document_cache import DocumentCache
+from modules.skill_matcher import get_skill_matcher
+from modules.pdf_supervisor import PdfParseError
+from modules.nlp_service import get_nlp_service
+from modules.jobs import JobQueueFull, TERMINAL_STATES, get_job_manager
+from modules.upload_pipeline import UploadPipeline
+from modules.uploads import HashingUploadFile, UploadRejected
 from modules.utils.file_utils import allowed_file
 
+class UploadRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Resumes stream straight to disk, hashed and checked as they arrive
+        if self.endpoint == 'upload_resume':
+            return HashingUploadFile(app.config['UPLOAD_FOLDER'])
+        return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+
 app = Flask(__name__)
+app.request_class = UploadRequest
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['MAX_BATCH_JOB_DESCRIPTIONS'] = 200
 
 # Ensure upload directory exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 # Initialize components
+# One NLP service (and one copy of its models) is shared by every component;
+# models load in the background and /ready reports when they are resident
+nlp_service = get_nlp_service()
+nlp_service.warm_up_async()
+# Parsed resumes are shared so each uploaded file is only parsed once
+document_cache = DocumentCache()
+print("Loading skills taxonomy...")
+skill_matcher = get_skill_matcher()
+print(f"Skills taxonomy loaded with {len(skill_matcher.skills)} skills.")
 print("Initializing ResumeAnalyzer...")
-resume_analyzer = ResumeAnalyzer()
+resume_analyzer = ResumeAnalyzer(
+    document_cache=document_cache,
+    skill_matcher=skill_matcher,
+    nlp_service=nlp_service
+)
+# Every similarity score (single, batch, ranking, recommendations) uses one model
+resume_analyzer.prepare_similarity_model()
 print("ResumeAnalyzer initialized.")
 print("Initializing CoverLetterGenerator...")
-cover_letter_gen = CoverLetterGenerator()
+cover_letter_gen = CoverLetterGenerator(
+    skill_matcher=skill_matcher,
+    nlp_service=nlp_service,
+    resume_analyzer=resume_analyzer
+)
 print("CoverLetterGenerator initialized.")
 print("Initializing InterviewSystem...")
-interview_system = InterviewSystem()
+interview_system = InterviewSystem(nlp_service=nlp_service)
+# Quiz options are graded once into a shared table; until it exists,
+# answers are graded live
+interview_system.prepare_grading_table_async()
 print("InterviewSystem initialized.")
 print("Initializing CareerRecommender...")
-career_recommender = CareerRecommender()
+career_recommender = CareerRecommender(skill_matcher=skill_matcher, nlp_service=nlp_service)
 print("CareerRecommender initialized.")
+# Uploads warm the resume caches in the background before the user asks
+upload_pipeline = UploadPipeline(resume_analyzer)
+
+def _wants_async():
+    return request.args.get('async', '').lower() in ('1', 'true', 'yes')
+
+def _submit_job(job_type, payload):
+    # Heavy work runs in the job pool; the client polls or subscribes for the result
+    job_manager = get_job_manager(components={
+        'resume_analyzer': resume_analyzer,
+        'cover_letter_gen': cover_letter_gen
+    })
+    try:
+        job_id = job_manager.submit(job_type, payload)
+    except JobQueueFull as e:
+        return jsonify({'error': str(e)}), 503
+    response = {'job_id': job_id, 'status_url': url_for('get_job', job_id=job_id)}
+    if _can_stream():
+        response['events_url'] = url_for('job_events', job_id=job_id)
+    return jsonify(response), 202
+
+def _can_stream():
+    # An event stream holds its worker for the life of the job, so it is only
+    # offered when the server runs several requests per process (gthread)
+    return bool(request.environ.get('wsgi.multithread'))
+
+@app.errorhandler(PdfParseError)
+def handle_pdf_parse_error(e):
+    # The document itself could not be parsed within its time/memory budget
+    return jsonify(e.to_dict()), 422
+
+@app.route('/health', methods=['GET'])
+def health():
+    # Liveness: the process is up and serving
+    return jsonify({'status': 'ok'}), 200
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    # Readiness: only route traffic here once the NLP models are loaded
+    status = nlp_service.status()
+    return jsonify(status), 200 if status['ready'] else 503
 
 @app.route('/')
 def index():
@@ -42,12 +122,23 @@ def upload_resume():
         return jsonify({'error': 'No selected file'}), 400
     
     if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        # Stored by content hash: identical uploads share one file and its caches
+        try:
+            filepath, digest, duplicate = file.stream.store()
+        except UploadRejected as e:
+            return jsonify({'error': f'Invalid file type. {e}.'}), 400
         # Pass the absolute path to the resume analyzer
         absolute_filepath = os.path.abspath(filepath)
-        return jsonify({'message': 'Resume uploaded successfully', 'resume_path': absolute_filepath}), 200
+        document_cache.remember_hash(absolute_filepath, digest)
+        # Parsing, analysis and recruiter indexing continue in the background
+        pipeline = upload_pipeline.submit(absolute_filepath)
+        return jsonify({
+            'message': 'Resume uploaded successfully',
+            'resume_path': absolute_filepath,
+            'filename': secure_filename(file.filename),
+            'duplicate': duplicate,
+            'pipeline': pipeline
+        }), 200
     else:
         return jsonify({'error': 'Invalid file type. Only PDF is allowed.'}), 400
 
@@ -57,18 +148,127 @@ def analyze_match():
     if not data or 'resume_path' not in data or 'job_description' not in data:
         return jsonify({'error': 'Missing required data'}), 400
     
+    if _wants_async():
+        return _submit_job('analyze_match', {
+            'resume_path': data['resume_path'],
+            'job_description': data['job_description']
+        })
+    
+    upload_pipeline.wait_for(data['resume_path'], 'skills')
     match_score = resume_analyzer.calculate_match_score(
         data['resume_path'],
         data['job_description']
     )
     return jsonify({'match_score': match_score})
 
+@app.route('/analyze-match-batch', methods=['POST'])
+def analyze_match_batch():
+    data = request.json
+    if not data or 'resume_path' not in data or 'job_descriptions' not in data:
+        return jsonify({'error': 'Missing required data'}), 400
+    
+    job_descriptions = data['job_descriptions']
+    if not isinstance(job_descriptions, list) or not all(isinstance(jd, str) for jd in job_descriptions):
+        return jsonify({'error': 'job_descriptions must be a list of strings'}), 400
+    if len(job_descriptions) > app.config['MAX_BATCH_JOB_DESCRIPTIONS']:
+        return jsonify({
+            'error': f"At most {app.config['MAX_BATCH_JOB_DESCRIPTIONS']} job descriptions per batch"
+        }), 400
+    
+    upload_pipeline.wait_for(data['resume_path'], 'skills')
+    matches = resume_analyzer.calculate_match_scores(data['resume_path'], job_descriptions)
+    return jsonify({'matches': matches})
+
+@app.route('/recruiter/rank-resumes', methods=['POST'])
+def rank_resumes():
+    data = request.json
+    if not data or 'job_description' not in data:
+        return jsonify({'error': 'Missing required data'}), 400
+    
+    try:
+        top_k = int(data.get('top_k', 50))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'top_k must be an integer'}), 400
+    required_skills = data.get('required_skills') or []
+    if not isinstance(required_skills, list):
+        return jsonify({'error': 'required_skills must be a list'}), 400
+    
+    candidates = resume_analyzer.rank_resumes(
+        data['job_description'],
+        top_k=max(1, min(top_k, 500)),
+        required_skills=required_skills
+    )
+    return jsonify({'candidates': candidates})
+
+@app.route('/job-postings', methods=['POST'])
+def add_job_posting():
+    data = request.json
+    if not data or not data.get('description'):
+        return jsonify({'error': 'Missing required data'}), 400
+
+    metadata = {key: value for key, value in data.items() if key not in ('id', 'description')}
+    job_id = resume_analyzer.job_store.add(data['description'], job_id=data.get('id'), metadata=metadata)
+    return jsonify({'id': job_id, 'job': resume_analyzer.job_store.get(job_id)})
+
+@app.route('/job-postings/ingest', methods=['POST'])
+def ingest_job_postings():
+    # JSON lines, either as an uploaded file or as the raw request body
+    if 'file' in request.files:
+        lines = request.files['file'].stream
+    else:
+        lines = request.get_data().splitlines()
+
+    try:
+        job_ids = resume_analyzer.job_store.ingest_jsonl(lines)
+    except (ValueError, AttributeError) as e:
+        return jsonify({'error': f'Invalid JSON lines: {e}'}), 400
+    return jsonify({'ingested': len(job_ids), 'ids': job_ids, 'total': len(resume_analyzer.job_store)})
+
+@app.route('/job-postings/<job_id>', methods=['GET', 'DELETE'])
+def job_posting(job_id):
+    if request.method == 'DELETE':
+        if not resume_analyzer.job_store.delete(job_id):
+            return jsonify({'error': 'Job posting not found'}), 404
+        return jsonify({'deleted': job_id})
+
+    job = resume_analyzer.job_store.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job posting not found'}), 404
+    return jsonify(job)
+
+@app.route('/recommend-jobs', methods=['POST'])
+def recommend_jobs():
+    data = request.json
+    if not data or 'resume_path' not in data:
+        return jsonify({'error': 'Missing required data'}), 400
+
+    try:
+        top_k = int(data.get('top_k', 10))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'top_k must be an integer'}), 400
+
+    upload_pipeline.wait_for(data['resume_path'], 'skills')
+    jobs = resume_analyzer.recommend_jobs(data['resume_path'], top_k=max(1, min(top_k, 100)))
+    return jsonify({'jobs': jobs})
+
+@app.route('/similarity-model/rebuild', methods=['POST'])
+def rebuild_similarity_model():
+    # Other serving processes pick up the new model on their next request
+    return jsonify(resume_analyzer.build_similarity_model())
+
 @app.route('/generate-cover-letter', methods=['POST'])
 def generate_cover_letter():
     data = request.json
     if not data or 'resume_path' not in data or 'job_description' not in data:
         return jsonify({'error': 'Missing required data'}), 400
     
+    if _wants_async():
+        return _submit_job('generate_cover_letter', {
+            'resume_path': data['resume_path'],
+            'job_description': data['job_description']
+        })
+    
+    upload_pipeline.wait_for(data['resume_path'], 'skills')
     cover_letter = cover_letter_gen.generate(
         data['resume_path'],
         data['job_description']
@@ -105,18 +305,21 @@ def start_interview():
 
 @app.route('/process-answer', methods=['POST'])
 def process_answer():
+    # Clients send the question's ID; the full question text is still accepted
+    question_id = request.form.get('question_id')
     question = request.form.get('question')
     selected_option = request.form.get('selected_option')
     role = request.form.get('role')
     level = request.form.get('level')
     focus = request.form.get('focus')
     
-    if not all([question, selected_option, role, level, focus]):
+    if not all([question_id or question, selected_option, role, level, focus]):
         return jsonify({'error': 'Missing required parameters'}), 400
     
     try:
         # Process the quiz answer
-        analysis = interview_system.process_quiz_answer(question, selected_option, role, level)
+        analysis = interview_system.process_quiz_answer(question, selected_option, role, level,
+                                                        question_id=question_id)
         
         return jsonify(analysis)
         
@@ -154,12 +357,15 @@ def get_resume_recommendations():
     
     try:
         # Extract skills and experience from resume
+        upload_pipeline.wait_for(resume_path, 'resume_data')
         resume_data = resume_analyzer.extract_resume_data(resume_path)
         
         # Get career recommendations based on resume data
         recommendations = career_recommender.get_recommendations_from_resume(resume_data)
         
         return jsonify({'recommendations': recommendations})
+    except PdfParseError:
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -175,6 +381,7 @@ def get_resume_data():
             return jsonify({'error': 'Resume file not found'}), 404
 
         # Extract resume data using ResumeAnalyzer
+        upload_pipeline.wait_for(resume_path, 'resume_data')
         resume_data = resume_analyzer.extract_resume_data(resume_path)
         if not resume_data:
             return jsonify({'error': 'Failed to extract resume data'}), 500
@@ -192,6 +399,8 @@ def get_resume_data():
             'certifications': resume_data.get('certifications', [])
         })
 
+    except PdfParseError:
+        raise
     except Exception as e:
         print(f"Error in get_resume_data: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -205,6 +414,12 @@ def update_resume():
     if not all([resume_path, resume_data]):
         return jsonify({'error': 'Resume path and data are required'}), 400
     
+    if _wants_async():
+        return _submit_job('update_resume', {
+            'resume_path': resume_path,
+            'resume_data': resume_data
+        })
+    
     try:
         # Update the resume with new data
         updated_path = resume_analyzer.update_resume(resume_path, resume_data)
@@ -236,11 +451,68 @@ def enhance_resume():
     
     try:
         # Get AI-powered resume enhancement suggestions
+        upload_pipeline.wait_for(resume_path, 'resume_data')
         enhancements = resume_analyzer.get_enhancement_suggestions(resume_path)
         return jsonify({'enhancements': enhancements})
+    except PdfParseError:
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found or expired'}), 404
+    return jsonify(job)
+
+@app.route('/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    if not _can_stream():
+        return jsonify({'error': 'Event streams need a threaded server; poll the job status URL instead',
+                        'status_url': url_for('get_job', job_id=job_id)}), 501
+    job_manager = get_job_manager()
+    if job_manager.get(job_id) is None:
+        return jsonify({'error': 'Job not found or expired'}), 404
+
+    def stream():
+        version = -1
+        while True:
+            job = job_manager.wait_for_update(job_id, version)
+            if job is None:
+                yield 'event: expired\ndata: {}\n\n'
+                return
+            if job['version'] == version:
+                # Keep idle connections open through proxies
+                yield ': keep-alive\n\n'
+                continue
+            version = job['version']
+            yield f"data: {json.dumps(job)}\n\n"
+            if job['status'] in TERMINAL_STATES:
+                return
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/upload-status', methods=['GET'])
+def upload_status():
+    resume_path = request.args.get('resume_path')
+    if not resume_path:
+        return jsonify({'error': 'Resume path is required'}), 400
+    if not os.path.exists(resume_path):
+        return jsonify({'error': 'Resume file not found'}), 404
+
+    status = upload_pipeline.status(resume_path)
+    if status is None:
+        return jsonify({'error': 'No upload pipeline for this resume'}), 404
+    return jsonify(status)
+
+@app.route('/cache-stats', methods=['GET'])
+def cache_stats():
+    stats = resume_analyzer.get_cache_stats()
+    stats['upload_pipeline'] = upload_pipeline.stats()
+    return jsonify(stats)
+
 @app.route('/static/<path:filename>')
 def serve_static(filename):
     return send_from_directory('static', filename)
@@ -0,0 +1,232 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread-safe in-process cache bounded by entry count."""
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class DiskCache:
+    """JSON-file cache bounded by total size and entry age.
+
+    Each key is stored in its own file, written atomically through a temporary
+    file and ``os.replace`` so readers never observe a partial entry. Entries
+    older than ``ttl`` seconds are dropped on access, and the least recently
+    used files are removed whenever the directory grows past ``max_bytes``.
+
+    Several processes may share ``cache_dir``, so the directory size is
+    measured on disk rather than tracked per process: the in-memory sizes are
+    rescanned every ``rescan_interval`` seconds and before any eviction, so
+    writes from other processes can overshoot the cap for at most that long.
+    """
+
+    def __init__(self, cache_dir, max_bytes=256 * 1024 * 1024, ttl=7 * 24 * 3600,
+                 rescan_interval=5):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.rescan_interval = rescan_interval
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._sizes = self._scan()
+        self._scanned_at = time.time()
+
+    def _scan(self):
+        """Record the size of every existing entry on disk."""
+        sizes = {}
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.json'):
+                try:
+                    sizes[entry.name[:-5]] = entry.stat().st_size
+                except OSError:
+                    pass  # Removed by another process
+        return sizes
+
+    def _rescan(self):
+        self._sizes = self._scan()
+        self._scanned_at = time.time()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return default
+
+        if self.ttl is not None and time.time() - stat.st_mtime > self.ttl:
+            with self._lock:
+                self._remove(key)
+                self.expirations += 1
+            return default
+
+        try:
+            with open(path, 'r') as f:
+                value = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable cache entry {path}: {e}")
+            return default
+
+        # Refresh the access time so size-based eviction is least recently used
+        try:
+            os.utime(path, (time.time(), stat.st_mtime))
+        except OSError:
+            pass
+        return value
+
+    def put(self, key, value):
+        data = json.dumps(value)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._sizes[key] = len(data.encode('utf-8'))
+            if time.time() - self._scanned_at > self.rescan_interval:
+                self._rescan()
+            self._enforce_size_cap()
+
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def size_bytes(self):
+        with self._lock:
+            self._rescan()
+            return sum(self._sizes.values())
+
+    def _remove(self, key):
+        self._sizes.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _enforce_size_cap(self):
+        """Evict least recently used entries until the cache fits in max_bytes."""
+        if sum(self._sizes.values()) <= self.max_bytes:
+            return
+        # Other processes write and evict too; decide from what is on disk now
+        self._rescan()
+        total = sum(self._sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        def last_access(key):
+            try:
+                return os.stat(self._path(key)).st_atime
+            except OSError:
+                return 0
+
+        for key in sorted(self._sizes, key=last_access):
+            if total <= self.max_bytes:
+                break
+            total -= self._sizes[key]
+            self._remove(key)
+            self.evictions += 1
+
+
+class TwoTierCache:
+    """In-process LRU tier in front of a bounded on-disk tier.
+
+    Reads check memory first, then disk (promoting disk hits into memory).
+    Writes go to both tiers. Hit, miss and eviction counters are exposed
+    through ``stats()`` so the tiers can be sized from production traffic.
+    """
+
+    def __init__(self, cache_dir, max_entries=128, max_bytes=256 * 1024 * 1024,
+                 ttl=7 * 24 * 3600):
+        self.memory = LRUCache(max_entries)
+        self.disk = DiskCache(cache_dir, max_bytes=max_bytes, ttl=ttl)
+        self._counters = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'writes': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def get(self, key, default=None):
+        value = self.memory.get(key)
+        if value is not None:
+            self._count('memory_hits')
+            return value
+
+        value = self.disk.get(key)
+        if value is not None:
+            self._count('disk_hits')
+            self.memory.put(key, value)
+            return value
+
+        self._count('misses')
+        return default
+
+    def put(self, key, value):
+        self.memory.put(key, value)
+        self.disk.put(key, value)
+        self._count('writes')
+
+    def delete(self, key):
+        self.memory.delete(key)
+        self.disk.delete(key)
+
+    def stats(self):
+        """Return hit/miss/eviction counters and current tier sizes."""
+        with self._lock:
+            stats = dict(self._counters)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats.update({
+            'hit_rate': round((lookups - stats['misses']) / lookups, 4) if lookups else 0.0,
+            'memory_entries': len(self.memory),
+            'memory_evictions': self.memory.evictions,
+            'disk_bytes': self.disk.size_bytes(),
+            'disk_evictions': self.disk.evictions,
+            'disk_expirations': self.disk.expirations
+        })
+        return stats
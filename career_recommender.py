@@ -1,15 +1,21 @@
 import json
 import os
-from .utils.nlp_utils import NLPProcessor
+from .nlp_service import get_nlp_service
+from .skill_matcher import get_skill_matcher
 
 class CareerRecommender:
-    def __init__(self):
-        self.nlp_processor = NLPProcessor()
+    def __init__(self, skill_matcher=None, nlp_service=None):
+        self.nlp_service = nlp_service or get_nlp_service()
+        self.skill_matcher = skill_matcher or get_skill_matcher()
         self.career_paths = self._load_career_paths()
         self.skill_weights = self._load_skill_weights()
         self.recommendation_history_dir = 'data/recommendations'
         os.makedirs(self.recommendation_history_dir, exist_ok=True)
 
+    @property
+    def nlp_processor(self):
+        return self.nlp_service.processor
+
     def _load_career_paths(self):
         """Load career paths and their requirements."""
         return {
@@ -194,8 +200,8 @@ class CareerRecommender:
             return 0
         
         # Convert to sets for easier comparison
-        user_skills_set = set(skill.lower() for skill in user_skills)
-        required_skills_set = set(skill.lower() for skill in required_skills)
+        user_skills_set = self._normalize_skills(user_skills)
+        required_skills_set = self._normalize_skills(required_skills)
         
         # Calculate match
         matching_skills = user_skills_set.intersection(required_skills_set)
@@ -220,24 +226,42 @@ class CareerRecommender:
             return 0
         
         # Convert to sets for easier comparison
-        interests_set = set(interest.lower() for interest in interests)
-        skills_set = set(skill.lower() for skill in skills)
+        interests_set = self._normalize_skills(interests)
+        skills_set = self._normalize_skills(skills)
         
         # Calculate match
         matching_interests = interests_set.intersection(skills_set)
         return len(matching_interests) / len(skills_set)
 
+    def _normalize_skills(self, skills):
+        """Lowercase skills after mapping each one to a single taxonomy name."""
+        return set(self._canonical_skill(skill) for skill in skills)
+
+    def _canonical_skill(self, skill):
+        """Lowercase taxonomy name for one skill entry.
+
+        Synonyms map to their canonical name. An entry that is not a taxonomy
+        name itself but mentions exactly one taxonomy skill ("SQL databases")
+        maps to that skill; anything else is kept as given.
+        """
+        canonical = self.skill_matcher.canonicalize(skill)
+        if canonical.lower() == ' '.join(skill.lower().split()):
+            found = self.skill_matcher.find_skills(skill)
+            if len(found) == 1:
+                canonical = found[0]
+        return canonical.lower()
+
     def _get_missing_skills(self, user_skills, required_skills):
         """Get list of skills that user is missing."""
-        user_skills_set = set(skill.lower() for skill in user_skills)
-        required_skills_set = set(skill.lower() for skill in required_skills)
+        user_skills_set = self._normalize_skills(user_skills)
+        required_skills_set = self._normalize_skills(required_skills)
         
         return list(required_skills_set - user_skills_set)
 
     def _get_matching_skills(self, user_skills, required_skills):
         """Get list of skills that user has."""
-        user_skills_set = set(skill.lower() for skill in user_skills)
-        required_skills_set = set(skill.lower() for skill in required_skills)
+        user_skills_set = self._normalize_skills(user_skills)
+        required_skills_set = self._normalize_skills(required_skills)
         
         return list(user_skills_set.intersection(required_skills_set))
 
@@ -340,9 +364,13 @@ class CareerRecommender:
         }
         
         # Analyze each career path
+        user_skills = self._normalize_skills(skills)
         for title, requirements in paths.items():
             # Check required skills
-            missing_skills = [skill for skill in requirements['required_skills'] if skill.lower() not in [s.lower() for s in skills]]
+            missing_skills = [
+                skill for skill in requirements['required_skills']
+                if self._canonical_skill(skill) not in user_skills
+            ]
             
             # Determine next steps based on missing skills and experience
             next_steps = []
@@ -1,11 +1,23 @@
-from .utils.file_utils import read_file_content
-from .utils.nlp_utils import NLPProcessor
-import re
+from .nlp_service import get_nlp_service
+from .skill_matcher import get_skill_matcher
+from .resume_analyzer import ResumeAnalyzer
+from .job_description import extract_company, extract_position, get_job_description_cache
 import random
 
 class CoverLetterGenerator:
-    def __init__(self):
-        self.nlp_processor = NLPProcessor()
+    def __init__(self, document_cache=None, skill_matcher=None, nlp_service=None,
+                 job_description_cache=None, resume_analyzer=None):
+        self.nlp_service = nlp_service or get_nlp_service()
+        self.skill_matcher = skill_matcher or get_skill_matcher()
+        self.job_description_cache = job_description_cache or get_job_description_cache()
+        # Resumes are read through the analyzer, so a cover letter uses the
+        # same parsed document and the same versioned skills artifact
+        self.resume_analyzer = resume_analyzer or ResumeAnalyzer(
+            document_cache=document_cache,
+            skill_matcher=self.skill_matcher,
+            nlp_service=self.nlp_service,
+            job_description_cache=self.job_description_cache
+        )
         
         # Templates for different sections
         self.templates = {
@@ -26,16 +38,21 @@ class CoverLetterGenerator:
             ]
         }
 
+    @property
+    def nlp_processor(self):
+        return self.nlp_service.processor
+
     def generate(self, resume_path, job_description):
         """Generate a personalized cover letter based on resume and job description."""
-        # Read and analyze both documents
-        resume_content = read_file_content(resume_path)
-        resume_analysis = self.nlp_processor.extract_skills(resume_content)
-        job_skills = self.nlp_processor.extract_skills(job_description)
-        
-        # Extract company name and position from job description
-        company = self._extract_company(job_description)
-        position = self._extract_position(job_description)
+        # Read and analyze both documents; resume skills are the analyzer's
+        # cached taxonomy skills for this file
+        resume_content = self.resume_analyzer._get_document(resume_path)
+        resume_analysis = self.resume_analyzer._get_resume_skills(resume_path, resume_content)
+        # Skills, company and position are parsed once per job description
+        job = self.job_description_cache.parse(job_description)
+        job_skills = job.skills
+        company = job.company
+        position = job.position
         
         # Get matching skills
         matching_skills = set(resume_analysis).intersection(set(job_skills))
@@ -63,36 +80,11 @@ class CoverLetterGenerator:
 
     def _extract_company(self, job_description):
         """Extract company name from job description."""
-        # Simple pattern matching for common company indicators
-        patterns = [
-            r'at\s+([A-Z][A-Za-z\s]+)',
-            r'with\s+([A-Z][A-Za-z\s]+)',
-            r'([A-Z][A-Za-z\s]+)\s+is\s+hiring'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, job_description)
-            if match:
-                return match.group(1).strip()
-        
-        return "the company"  # Default if company name not found
+        return extract_company(job_description)
 
     def _extract_position(self, job_description):
         """Extract job position from job description."""
-        # Look for common position indicators
-        patterns = [
-            r'position:\s*([A-Za-z\s]+)',
-            r'role:\s*([A-Za-z\s]+)',
-            r'seeking\s+a\s+([A-Za-z\s]+)',
-            r'looking\s+for\s+a\s+([A-Za-z\s]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, job_description, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        
-        return "this position"  # Default if position not found
+        return extract_position(job_description)
 
     def _extract_achievement(self, experience):
         """Extract a notable achievement from experience."""
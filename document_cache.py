@@ -0,0 +1,95 @@
+import hashlib
+import os
+from .cache import LRUCache, TwoTierCache
+from .parsed_document import ParsedDocument
+
+
+class DocumentCache:
+    """Content-addressed cache of extracted document text and derived artifacts.
+
+    Entries are keyed by the SHA-256 of the file contents, so the same resume
+    uploaded under different names (or re-read by different endpoints) is only
+    parsed once. Each artifact is its own entry, keyed by digest, name and the
+    producer's version, so a version bump never serves output of older code
+    and processes writing different artifacts for one file never overwrite
+    each other. Recently used entries are kept in memory up to
+    ``max_entries`` and every entry is written through to ``cache_dir`` so it
+    survives eviction and restarts. Recently used documents are also kept
+    parsed, so every component reading a file shares one ParsedDocument.
+    """
+
+    def __init__(self, cache_dir='cache/documents', max_entries=512,
+                 max_bytes=256 * 1024 * 1024, ttl=7 * 24 * 3600):
+        self.cache_dir = cache_dir
+        self._cache = TwoTierCache(cache_dir, max_entries=max_entries,
+                                   max_bytes=max_bytes, ttl=ttl)
+        self._file_hashes = LRUCache(max_entries=max_entries)    # path -> (signature, digest)
+        self._documents = LRUCache(max_entries=32)
+
+    def file_hash(self, filepath):
+        """Return the SHA-256 hex digest of a file, memoized on (mtime, size)."""
+        stat = os.stat(filepath)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        memo = self._file_hashes.get(filepath)
+        if memo and memo[0] == signature:
+            return memo[1]
+
+        sha256 = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+
+        self._file_hashes.put(filepath, (signature, digest))
+        return digest
+
+    def remember_hash(self, filepath, digest):
+        """Record a digest computed elsewhere (e.g. while the file was uploaded)."""
+        stat = os.stat(filepath)
+        self._file_hashes.put(filepath, ((stat.st_mtime_ns, stat.st_size), digest))
+
+    def get_text(self, filepath, loader):
+        """Return the extracted text of a file, calling ``loader`` only on a miss."""
+        return self.get_artifact(filepath, 'text', lambda: loader(filepath))
+
+    def get_document(self, filepath, loader):
+        """Return a file's text as a ParsedDocument shared by every caller."""
+        digest = self.file_hash(filepath)
+        document = self._documents.get(digest)
+        if document is None:
+            document = ParsedDocument(self.get_text(filepath, loader))
+            self._documents.put(digest, document)
+        return document
+
+    @staticmethod
+    def _artifact_key(digest, name, version=None):
+        return f"{digest}-{name}" if version is None else f"{digest}-{name}-v{version}"
+
+    def get_artifact(self, filepath, name, compute, version=None):
+        """Return a named artifact derived from a file, computing it on a miss.
+
+        ``version`` identifies the code that produces the artifact; bump it
+        when that output changes.
+        """
+        digest = self.file_hash(filepath)
+        # Entries are wrapped so a cached None or empty value still counts as a hit
+        entry = self._cache.get(self._artifact_key(digest, name, version))
+        if entry is not None:
+            return entry['value']
+
+        value = compute()
+        self.put_artifact(digest, name, value, version=version)
+        return value
+
+    def peek_artifact(self, filepath, name, version=None):
+        """Return a cached artifact without computing it, or None."""
+        entry = self._cache.get(self._artifact_key(self.file_hash(filepath), name, version))
+        return entry['value'] if entry is not None else None
+
+    def put_artifact(self, digest, name, value, version=None):
+        """Store an artifact for the document with the given content hash."""
+        self._cache.put(self._artifact_key(digest, name, version), {'value': value})
+
+    def stats(self):
+        """Return hit/miss/eviction counters for the underlying cache."""
+        return self._cache.stats()
@@ -0,0 +1,50 @@
+# Production serving configuration for CareerPro AI.
+#
+#   gunicorn -c gunicorn.conf.py app:app
+#
+# The app is imported once in the master process (preload_app), which loads
+# the interview question bank, career catalog, skills taxonomy and NLP models
+# before any worker is forked. Workers then share those pages copy-on-write
+# instead of each loading their own copy.
+import gc
+import multiprocessing
+import os
+
+bind = os.environ.get('CAREERPRO_BIND', '0.0.0.0:5001')
+workers = int(os.environ.get('CAREERPRO_WORKERS', multiprocessing.cpu_count()))
+# Threaded workers, so a job event stream occupies one thread rather than a
+# whole worker; with CAREERPRO_THREADS=1 the app serves job status by polling only
+threads = int(os.environ.get('CAREERPRO_THREADS', 4))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+preload_app = True
+
+# Recycle workers periodically so slow leaks cannot accumulate; the jitter
+# keeps all workers from restarting at the same moment
+max_requests = int(os.environ.get('CAREERPRO_MAX_REQUESTS', 1000))
+max_requests_jitter = max(1, max_requests // 10)
+
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+
+def when_ready(server):
+    """Finish loading shared state in the master before workers fork."""
+    import app as careerpro_app
+
+    # Block until the NLP models are resident so every worker inherits them
+    careerpro_app.nlp_service.warm_up()
+    # Workers map the quiz grading table instead of each grading every option
+    careerpro_app.interview_system.prepare_grading_table()
+
+    # Move everything allocated so far out of the collector's generations;
+    # otherwise the first collection in each worker touches (and copies)
+    # every shared object page
+    gc.collect()
+    gc.freeze()
+    server.log.info("Shared state loaded; forking %s workers", server.cfg.workers)
+
+
+def post_fork(server, worker):
+    server.log.info("Worker spawned (pid: %s)", worker.pid)
@@ -0,0 +1,161 @@
+import hashlib
+import re
+import threading
+from .cache import LRUCache
+from .parsed_document import ParsedDocument
+from .similarity import hash_term_counts
+from .skill_matcher import get_skill_matcher
+
+# Headings that open a section, by the section they start
+SECTION_HEADINGS = {
+    'requirements': ('requirements', 'qualifications', 'required skills', 'must have',
+                     'what you bring', 'what we are looking for', "what we're looking for",
+                     'who you are', 'skills'),
+    'responsibilities': ('responsibilities', "what you'll do", 'what you will do', 'duties',
+                         'the role', 'your role', 'key responsibilities'),
+    'preferred': ('preferred', 'preferred qualifications', 'nice to have', 'bonus points',
+                  'pluses'),
+    'benefits': ('benefits', 'perks', 'what we offer', 'compensation')
+}
+_HEADING_LOOKUP = {heading: section for section, headings in SECTION_HEADINGS.items()
+                   for heading in headings}
+_BULLET_PATTERN = re.compile(r'^\s*(?:[-*•●▪]|\d+[.)])\s*')
+
+
+def extract_company(job_description):
+    """Extract company name from job description."""
+    # Simple pattern matching for common company indicators
+    patterns = [
+        r'at\s+([A-Z][A-Za-z\s]+)',
+        r'with\s+([A-Z][A-Za-z\s]+)',
+        r'([A-Z][A-Za-z\s]+)\s+is\s+hiring'
+    ]
+    
+    for pattern in patterns:
+        match = re.search(pattern, job_description)
+        if match:
+            return match.group(1).strip()
+    
+    return "the company"  # Default if company name not found
+
+def extract_position(job_description):
+    """Extract job position from job description."""
+    # Look for common position indicators
+    patterns = [
+        r'position:\s*([A-Za-z\s]+)',
+        r'role:\s*([A-Za-z\s]+)',
+        r'seeking\s+a\s+([A-Za-z\s]+)',
+        r'looking\s+for\s+a\s+([A-Za-z\s]+)'
+    ]
+    
+    for pattern in patterns:
+        match = re.search(pattern, job_description, re.IGNORECASE)
+        if match:
+            return match.group(1).strip()
+    
+    return "this position"  # Default if position not found
+
+def extract_requirement_sections(job_description):
+    """Split a job description into its requirement, responsibility, preferred and benefit bullets."""
+    sections = {}
+    current = None
+    for line in job_description.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        heading = stripped.rstrip(':').strip().lower()
+        if len(heading) <= 60 and heading in _HEADING_LOOKUP:
+            current = _HEADING_LOOKUP[heading]
+            sections.setdefault(current, [])
+        elif current is not None:
+            item = _BULLET_PATTERN.sub('', stripped)
+            if item:
+                sections[current].append(item)
+    return sections
+
+def text_hash(text):
+    """Hash of the exact text.
+
+    Not normalized: company, position and section extraction depend on case
+    and line breaks, so two texts share a parse only when they are identical.
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ParsedJobDescription:
+    """Everything derived from one job description, computed once.
+
+    ``document`` is the text as a ParsedDocument so its sections and
+    derived results are shared too; ``term_counts`` are the hashed term counts
+    used by the resume index and job store.
+    """
+
+    def __init__(self, text, skill_matcher):
+        self.key = text_hash(text)
+        self.document = ParsedDocument(text)
+        self.skills = skill_matcher.find_skills(text)
+        self.company = extract_company(text)
+        self.position = extract_position(text)
+        self.term_counts = hash_term_counts([text])
+        self.requirement_sections = extract_requirement_sections(text)
+
+    @property
+    def text(self):
+        return self.document.text
+
+    def to_dict(self):
+        return {
+            'key': self.key,
+            'company': self.company,
+            'position': self.position,
+            'skills': self.skills,
+            'requirement_sections': self.requirement_sections
+        }
+
+
+class JobDescriptionCache:
+    """LRU cache of ParsedJobDescription keyed by the hash of the exact text."""
+
+    def __init__(self, max_entries=256, skill_matcher=None):
+        self.skill_matcher = skill_matcher or get_skill_matcher()
+        self._entries = LRUCache(max_entries=max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, job_description):
+        if isinstance(job_description, ParsedJobDescription):
+            return job_description
+        key = text_hash(job_description)
+        parsed = self._entries.get(key)
+        if parsed is not None:
+            self.hits += 1
+            return parsed
+        self.misses += 1
+        parsed = ParsedJobDescription(job_description, self.skill_matcher)
+        self._entries.put(key, parsed)
+        return parsed
+
+    def stats(self):
+        """Return hit/miss counters and the number of cached job descriptions."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'entries': len(self._entries),
+            'evictions': self._entries.evictions
+        }
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_job_description_cache():
+    """Return the process-wide JobDescriptionCache, creating it on first use."""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = JobDescriptionCache()
+    return _shared_cache
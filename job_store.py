@@ -0,0 +1,294 @@
+import heapq
+import json
+import math
+import os
+import tempfile
+import threading
+from scipy import sparse
+from .job_description import get_job_description_cache
+from .similarity import HASHED_TERM_FEATURES, get_similarity_engine, hash_term_counts
+from .operation_log import OperationLog
+
+# Rewrite the snapshot once this many operations have been appended to the log
+COMPACT_AFTER_OPERATIONS = 500
+
+
+class JobStore:
+    """Local corpus of job descriptions with inverted indexes for retrieval.
+
+    At ingest each job's hashed term counts, taxonomy skills, company and
+    position are computed once and kept with the job. Text similarity
+    weights the counts with the similarity engine's IDF table, so scores are
+    on the same scale as ``/analyze-match``. Term and skill
+    inverted indexes (term -> {job: weight}, skill -> jobs) answer "best
+    jobs for this resume" by only visiting jobs that share a term or skill
+    with it. Adds and deletes update the indexes in place and are appended
+    to an operation log, so nothing is rebuilt from scratch. The log is
+    shared by every worker process, and each applies the others' entries
+    before serving a read (see ``OperationLog``).
+    """
+
+    def __init__(self, store_dir='data/job_store', job_description_cache=None,
+                 compact_after=COMPACT_AFTER_OPERATIONS, similarity_engine=None):
+        self.store_dir = store_dir
+        self.compact_after = compact_after
+        self._similarity_engine = similarity_engine
+        self.job_description_cache = job_description_cache or get_job_description_cache()
+        self._lock = threading.RLock()
+        self._jobs = {}             # job id -> stored job
+        self._term_postings = {}    # term feature -> {job id: weight}
+        self._skill_postings = {}   # lowercase skill -> set of job ids
+        self._norms = (None, {})    # (engine, job id -> TF-IDF norm)
+        os.makedirs(self.store_dir, exist_ok=True)
+        self._log = OperationLog(self._path('operations.jsonl'))
+        with self._lock, self._log.locked():
+            self._load_snapshot()
+            self._catch_up()
+
+    @property
+    def similarity_engine(self):
+        return self._similarity_engine or get_similarity_engine()
+
+    def __len__(self):
+        with self._lock:
+            self._sync()
+            return len(self._jobs)
+
+    def __contains__(self, job_id):
+        with self._lock:
+            self._sync()
+            return str(job_id) in self._jobs
+
+    def get(self, job_id):
+        with self._lock:
+            self._sync()
+            job = self._jobs.get(str(job_id))
+            return self._public(job) if job else None
+
+    def descriptions(self):
+        with self._lock:
+            self._sync()
+            return [job['description'] for job in self._jobs.values()]
+
+    def add(self, description, job_id=None, metadata=None):
+        """Ingest one job description and return its id."""
+        parsed = self.job_description_cache.parse(description)
+        # Ids are strings, as in the /job-postings/<job_id> route, whatever
+        # JSON type they were ingested with
+        job_id = parsed.key if job_id in (None, '') else str(job_id)
+        vector = parsed.term_counts
+        job = {
+            'id': job_id,
+            'description': description,
+            'company': parsed.company,
+            'position': parsed.position,
+            'skills': parsed.skills,
+            'requirement_sections': parsed.requirement_sections,
+            'metadata': metadata or {},
+            'terms': dict(zip(vector.indices.tolist(), vector.data.tolist()))
+        }
+        self._write({'op': 'add', 'job': self._serialize(job)})
+        return job_id
+
+    def ingest_jsonl(self, lines):
+        """Ingest JSON lines with a ``description`` and optional ``id``.
+
+        Any other fields (title, location, url...) are kept as metadata.
+        Returns the ids of the ingested jobs.
+        """
+        job_ids = []
+        for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            description = record.pop('description', '')
+            if not description:
+                continue
+            job_id = record.pop('id', None)
+            job_ids.append(self.add(description, job_id=job_id, metadata=record))
+        return job_ids
+
+    def delete(self, job_id):
+        job_id = str(job_id)
+        with self._lock, self._log.locked(exclusive=True):
+            self._catch_up()
+            if job_id not in self._jobs:
+                return False
+            self._write({'op': 'delete', 'id': job_id})
+            return True
+
+    def top_jobs_for_resume(self, resume_text, resume_skills, top_k=10):
+        """Return the ``top_k`` stored jobs that best match a resume.
+
+        Scores use the same 70% text similarity / 30% skill match weights as
+        ``ResumeAnalyzer.calculate_match_score``; skill match is the share of
+        the job's skills that the resume covers.
+        """
+        engine = self.similarity_engine
+        vector = engine.weight(hash_term_counts([resume_text]))
+        resume_skill_set = set(resume_skills)
+
+        with self._lock:
+            self._sync()
+            # Term-at-a-time accumulation over the postings the resume touches;
+            # postings hold raw counts, weighted here and normalized per job
+            similarity = {}
+            for term, weight in zip(vector.indices.tolist(), vector.data.tolist()):
+                weight *= self._idf(engine, term)
+                for job_id, count in self._term_postings.get(term, {}).items():
+                    similarity[job_id] = similarity.get(job_id, 0.0) + weight * count
+            for job_id in similarity:
+                similarity[job_id] /= self._norm(engine, job_id)
+
+            skill_overlap = {}
+            for skill in resume_skill_set:
+                for job_id in self._skill_postings.get(skill.lower(), ()):
+                    skill_overlap[job_id] = skill_overlap.get(job_id, 0) + 1
+
+            def score(job_id):
+                job_skills = self._jobs[job_id]['skills']
+                skill_match = skill_overlap.get(job_id, 0) / len(job_skills) if job_skills else 0
+                return 0.7 * similarity.get(job_id, 0.0) + 0.3 * skill_match
+
+            candidates = set(similarity) | set(skill_overlap)
+            best = heapq.nlargest(top_k, ((score(job_id), job_id) for job_id in candidates))
+
+            results = []
+            for overall, job_id in best:
+                job = self._jobs[job_id]
+                job_skill_set = set(job['skills'])
+                skill_match = (skill_overlap.get(job_id, 0) / len(job_skill_set)) if job_skill_set else 0
+                result = self._public(job)
+                result.update({
+                    'overall_score': round(overall * 100, 2),
+                    'similarity_score': round(similarity.get(job_id, 0.0) * 100, 2),
+                    'skill_match_score': round(skill_match * 100, 2),
+                    'matching_skills': list(resume_skill_set & job_skill_set),
+                    'missing_skills': list(job_skill_set - resume_skill_set)
+                })
+                results.append(result)
+            return results
+
+    def term_matrix(self):
+        """Hashed term counts of every stored job, one row each."""
+        with self._lock:
+            self._sync()
+            rows, columns, data = [], [], []
+            for row, job in enumerate(self._jobs.values()):
+                rows.extend([row] * len(job['terms']))
+                columns.extend(job['terms'])
+                data.extend(job['terms'].values())
+            return sparse.csr_matrix((data, (rows, columns)),
+                                     shape=(len(self._jobs), HASHED_TERM_FEATURES))
+
+    @staticmethod
+    def _idf(engine, term):
+        return 1.0 if engine.idf is None else float(engine.idf[term])
+
+    def _norm(self, engine, job_id):
+        """L2 norm of a job's TF-IDF vector, kept until the model changes."""
+        if self._norms[0] is not engine:
+            self._norms = (engine, {})
+        norms = self._norms[1]
+        if job_id not in norms:
+            terms = self._jobs[job_id]['terms']
+            norms[job_id] = math.sqrt(sum(
+                (count * self._idf(engine, term)) ** 2 for term, count in terms.items()
+            )) or 1.0
+        return norms[job_id]
+
+    def _public(self, job):
+        public = {key: job[key] for key in ('id', 'company', 'position', 'skills', 'metadata', 'description')}
+        public['requirement_sections'] = job.get('requirement_sections', {})
+        return public
+
+    def _index(self, job):
+        if job['id'] in self._jobs:
+            self._unindex(job['id'])
+        self._jobs[job['id']] = job
+        self._norms[1].pop(job['id'], None)
+        for term, weight in job['terms'].items():
+            self._term_postings.setdefault(term, {})[job['id']] = weight
+        for skill in job['skills']:
+            self._skill_postings.setdefault(skill.lower(), set()).add(job['id'])
+
+    def _unindex(self, job_id):
+        job = self._jobs.pop(job_id)
+        self._norms[1].pop(job_id, None)
+        for term in job['terms']:
+            postings = self._term_postings.get(term)
+            if postings is not None:
+                postings.pop(job_id, None)
+                if not postings:
+                    del self._term_postings[term]
+        for skill in job['skills']:
+            postings = self._skill_postings.get(skill.lower())
+            if postings is not None:
+                postings.discard(job_id)
+                if not postings:
+                    del self._skill_postings[skill.lower()]
+
+    # Persistence
+
+    def _path(self, name):
+        return os.path.join(self.store_dir, name)
+
+    def _serialize(self, job):
+        # JSON object keys must be strings
+        return dict(job, terms=[[term, weight] for term, weight in job['terms'].items()])
+
+    def _deserialize(self, record):
+        # Logs written before ids were normalized may hold integer ids
+        return dict(record, id=str(record['id']),
+                    terms={int(term): weight for term, weight in record['terms']})
+
+    def _load_snapshot(self):
+        self._jobs, self._term_postings, self._skill_postings = {}, {}, {}
+        self._norms = (None, {})
+        if os.path.exists(self._path('jobs.json')):
+            with open(self._path('jobs.json'), 'r') as f:
+                for record in json.load(f):
+                    self._index(self._deserialize(record))
+
+    def _replay(self, operation):
+        if operation['op'] == 'add':
+            self._index(self._deserialize(operation['job']))
+        elif str(operation['id']) in self._jobs:
+            self._unindex(str(operation['id']))
+
+    def _catch_up(self):
+        """Apply operations other processes logged since the last call."""
+        reset, operations = self._log.read_new()
+        if reset:
+            self._load_snapshot()
+        for operation in operations:
+            self._replay(operation)
+
+    def _sync(self):
+        with self._log.locked():
+            self._catch_up()
+
+    def _write(self, operation):
+        """Apply an operation locally and log it, after catching up with other processes."""
+        with self._lock, self._log.locked(exclusive=True):
+            self._catch_up()
+            self._replay(operation)
+            self._log.append(operation)
+            if self._log.operations >= self.compact_after:
+                self._compact()
+
+    def compact(self):
+        """Write all jobs to the snapshot and start a new operation log."""
+        with self._lock, self._log.locked(exclusive=True):
+            self._catch_up()
+            self._compact()
+
+    def _compact(self):
+        # Caught up under the exclusive lock, so the snapshot holds every process's jobs
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.json')
+        with os.fdopen(fd, 'w') as f:
+            json.dump([self._serialize(job) for job in self._jobs.values()], f)
+        os.replace(tmp_path, self._path('jobs.json'))
+        self._log.rotate()
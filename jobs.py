@@ -0,0 +1,354 @@
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Finished jobs are kept this long so clients can collect their results
+JOB_RESULT_TTL_SECONDS = 15 * 60
+MAX_JOB_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+MAX_PENDING_JOBS = 64
+# How often a process following another worker's job re-reads its record
+JOB_POLL_INTERVAL_SECONDS = 0.5
+
+TERMINAL_STATES = ('succeeded', 'failed')
+
+
+class JobQueueFull(Exception):
+    """Raised when too many jobs are already queued or running."""
+
+
+# Components used inside pool processes. The parent registers its instances
+# before the pool forks so workers inherit them; otherwise they are built on
+# first use in the worker.
+_components = {}
+_progress_queue = None
+
+
+def _get_component(name):
+    if name not in _components:
+        if name == 'resume_analyzer':
+            from .resume_analyzer import ResumeAnalyzer
+            _components[name] = ResumeAnalyzer()
+        elif name == 'cover_letter_gen':
+            from .cover_letter import CoverLetterGenerator
+            _components[name] = CoverLetterGenerator(resume_analyzer=_get_component('resume_analyzer'))
+        else:
+            raise KeyError(f"Unknown job component: {name}")
+    return _components[name]
+
+
+def _init_worker(progress_queue):
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def report_progress(job_id, progress, stage):
+    """Publish a progress update from inside a job."""
+    if _progress_queue is not None:
+        _progress_queue.put((job_id, progress, stage))
+
+
+# Each handler reports the stage it is entering and the share of work done
+# so far, so progress only moves once a stage has actually finished
+
+def _run_analyze_match(job_id, payload):
+    analyzer = _get_component('resume_analyzer')
+    report_progress(job_id, 0, 'reading resume')
+    # Parsed once here; scoring reads the same document from the cache
+    analyzer._get_document(payload['resume_path'])
+    report_progress(job_id, 60, 'scoring match')
+    return analyzer.calculate_match_score(payload['resume_path'], payload['job_description'])
+
+
+def _run_generate_cover_letter(job_id, payload):
+    generator = _get_component('cover_letter_gen')
+    report_progress(job_id, 0, 'reading resume')
+    generator.resume_analyzer._get_document(payload['resume_path'])
+    report_progress(job_id, 60, 'writing cover letter')
+    return generator.generate(payload['resume_path'], payload['job_description'])
+
+
+def _run_update_resume(job_id, payload):
+    analyzer = _get_component('resume_analyzer')
+    report_progress(job_id, 0, 'building PDF')
+    resume_path = analyzer.update_resume(
+        payload['resume_path'], payload['resume_data'],
+        on_stage=lambda progress, stage: report_progress(job_id, progress, stage)
+    )
+    return {'resume_path': resume_path}
+
+
+JOB_HANDLERS = {
+    'analyze_match': _run_analyze_match,
+    'generate_cover_letter': _run_generate_cover_letter,
+    'update_resume': _run_update_resume
+}
+
+
+def _run_job(job_id, job_type, payload):
+    """Entry point executed in a pool process."""
+    try:
+        return 'succeeded', JOB_HANDLERS[job_type](job_id, payload)
+    except Exception as e:
+        error = e.to_dict() if hasattr(e, 'to_dict') else {'error': str(e)}
+        return 'failed', error
+
+
+def _process_identity(pid):
+    """``[pid, start time]``: unlike the pid alone, never reused by a later process."""
+    try:
+        with open(f'/proc/{pid}/stat', 'r') as f:
+            # Fields after the command name, which may itself contain spaces
+            return [pid, int(f.read().rsplit(')', 1)[1].split()[19])]
+    except (OSError, ValueError, IndexError):
+        return [pid, None]
+
+
+def _process_running(identity):
+    pid, started = identity
+    if started is not None:
+        return _process_identity(pid) == identity
+    # No /proc: fall back to whether any process has this pid
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class JobManager:
+    """Runs CPU-heavy requests in a bounded process pool.
+
+    ``submit`` returns a job id immediately. Job state (status, progress,
+    stage, result) is written to ``jobs_dir`` on every change, so any worker
+    process can answer ``get`` and ``wait_for_update`` for a job another
+    worker submitted; the submitting process also keeps its jobs in memory
+    and wakes local waiters directly. Finished jobs expire after
+    ``result_ttl`` seconds. A record whose submitting process has died is
+    marked failed when it is next read, and every record is read once when
+    a manager starts, so orphaned jobs end and then expire like any other.
+    """
+
+    def __init__(self, max_workers=MAX_JOB_WORKERS, max_pending=MAX_PENDING_JOBS,
+                 result_ttl=JOB_RESULT_TTL_SECONDS, components=None, jobs_dir='data/jobs'):
+        _components.update(components or {})
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.jobs_dir = jobs_dir
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        self._jobs = {}
+        self._condition = threading.Condition()
+        self.max_workers = max_workers
+        self._progress_queue = multiprocessing.Queue()
+        self._executor = self._new_executor()
+        listener = threading.Thread(target=self._listen_for_progress,
+                                    name='job-progress', daemon=True)
+        listener.start()
+        self._sweep()
+
+    def submit(self, job_type, payload):
+        if job_type not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        with self._condition:
+            self._purge_expired()
+            active = sum(1 for job in self._jobs.values() if job['status'] not in TERMINAL_STATES)
+            if active >= self.max_pending:
+                raise JobQueueFull("Too many jobs in progress, try again later")
+
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {
+                'id': job_id,
+                'type': job_type,
+                'status': 'queued',
+                'progress': 0,
+                'stage': 'queued',
+                'result': None,
+                'error': None,
+                'created_at': time.time(),
+                'finished_at': None,
+                'owner': _process_identity(os.getpid()),
+                'version': 0
+            }
+            self._save(self._jobs[job_id])
+
+        try:
+            future = self._executor.submit(_run_job, job_id, job_type, payload)
+        except BrokenProcessPool:
+            # A worker died abruptly; replace the pool and retry once
+            self._executor = self._new_executor()
+            future = self._executor.submit(_run_job, job_id, job_type, payload)
+        future.add_done_callback(lambda f: self._finish(job_id, f))
+        return job_id
+
+    def _new_executor(self):
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self._progress_queue,)
+        )
+
+    def get(self, job_id):
+        """Return a snapshot of a job, or None if unknown or expired."""
+        with self._condition:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+            if job:
+                return dict(job)
+        return self._load(job_id)
+
+    def wait_for_update(self, job_id, version, timeout=15):
+        """Block until the job changes past ``version`` or ``timeout`` elapses."""
+        with self._condition:
+            if job_id in self._jobs:
+                self._condition.wait_for(
+                    lambda: job_id not in self._jobs or self._jobs[job_id]['version'] > version,
+                    timeout=timeout
+                )
+                job = self._jobs.get(job_id)
+                return dict(job) if job else None
+
+        # Submitted by another worker process: follow its record on disk
+        deadline = time.time() + timeout
+        while True:
+            job = self._load(job_id)
+            if job is None or job['version'] > version or time.time() >= deadline:
+                return job
+            time.sleep(JOB_POLL_INTERVAL_SECONDS)
+
+    def _update(self, job_id, **fields):
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None or job['status'] in TERMINAL_STATES:
+                return
+            job.update(fields)
+            job['version'] += 1
+            self._save(job)
+            self._condition.notify_all()
+
+    def _listen_for_progress(self):
+        while True:
+            try:
+                job_id, progress, stage = self._progress_queue.get()
+            except (EOFError, OSError):
+                return
+            self._update(job_id, status='running', progress=progress, stage=stage)
+
+    def _finish(self, job_id, future):
+        try:
+            status, outcome = future.result()
+        except Exception as e:
+            # The pool itself failed (e.g. a worker was killed)
+            status, outcome = 'failed', {'error': str(e)}
+
+        fields = {'status': status, 'stage': status, 'finished_at': time.time()}
+        if status == 'succeeded':
+            fields.update(progress=100, result=outcome)
+        else:
+            fields['error'] = outcome
+
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields)
+            job['version'] += 1
+            self._save(job)
+            self._condition.notify_all()
+
+    def _path(self, job_id):
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def _save(self, job):
+        # Replaced atomically so readers in other processes never see a partial record
+        fd, tmp_path = tempfile.mkstemp(dir=self.jobs_dir, suffix='.json')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(job, f)
+        os.replace(tmp_path, self._path(job['id']))
+
+    def _load(self, job_id):
+        # Job ids are hex uuids; anything else cannot name a record
+        if not job_id or not all(c in '0123456789abcdef' for c in job_id):
+            return None
+        try:
+            with open(self._path(job_id), 'r') as f:
+                job = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if job['status'] not in TERMINAL_STATES and self._orphaned(job):
+            job.update(status='failed', stage='failed', finished_at=time.time(),
+                       error={'error': 'The server process running this job exited'})
+            job['version'] += 1
+            self._save(job)
+        if job['finished_at'] is not None and job['finished_at'] < time.time() - self.result_ttl:
+            self._remove(job_id)
+            return None
+        return job
+
+    def _orphaned(self, job):
+        """Whether an unfinished job's submitting process is gone."""
+        if job.get('owner') is None:
+            # Written before records named their owner
+            return job['created_at'] < time.time() - self.result_ttl
+        return not _process_running(job['owner'])
+
+    def _sweep(self):
+        """Fail orphaned jobs and delete expired records left by earlier processes."""
+        for entry in os.scandir(self.jobs_dir):
+            if entry.name.endswith('.json'):
+                self._load(entry.name[:-len('.json')])
+
+    def _remove(self, job_id):
+        try:
+            os.remove(self._path(job_id))
+        except FileNotFoundError:
+            pass
+
+    def _purge_expired(self):
+        cutoff = time.time() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job['finished_at'] is not None and job['finished_at'] < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+            self._remove(job_id)
+        if expired:
+            self._condition.notify_all()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_shared_manager = None
+_shared_manager_lock = threading.Lock()
+
+
+def get_job_manager(components=None):
+    """Return this process's JobManager, creating it on first use.
+
+    The manager owns a process pool and a progress listener thread, so it is
+    created lazily in each serving process rather than inherited across fork.
+    """
+    global _shared_manager
+    if _shared_manager is None:
+        with _shared_manager_lock:
+            if _shared_manager is None:
+                _shared_manager = JobManager(components=components)
+    return _shared_manager
+
+
+def _reset_after_fork():
+    global _shared_manager
+    _shared_manager = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
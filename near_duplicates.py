@@ -0,0 +1,121 @@
+import os
+import re
+import threading
+import zlib
+import numpy as np
+from .operation_log import OperationLog
+
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 16              # 8 rows per band: pairs above ~0.7 Jaccard collide
+SHINGLE_WORDS = 5
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+# Fixed hash family so signatures stay comparable across restarts
+_PRIME = np.uint64(4294967311)      # smallest prime above 2**32
+_random = np.random.RandomState(20240521)
+_A = _random.randint(1, 2 ** 32 - 1, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+_B = _random.randint(0, 2 ** 32 - 1, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+def minhash_signature(text):
+    """MinHash signature over word shingles of ``text`` as a uint32 array."""
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) < SHINGLE_WORDS:
+        shingles = {' '.join(words)}
+    else:
+        shingles = {' '.join(words[i:i + SHINGLE_WORDS])
+                    for i in range(len(words) - SHINGLE_WORDS + 1)}
+    hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles),
+                         dtype=np.uint64, count=len(shingles))
+    # (a * x + b) mod p for every permutation and shingle; the minimum per row
+    # is the signature. Values stay below 2**64, so uint64 never overflows.
+    permuted = (np.outer(_A, hashes) + _B[:, None]) % _PRIME
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def estimate_similarity(first, second):
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return float(np.count_nonzero(first == second)) / len(first)
+
+
+class NearDuplicateIndex:
+    """LSH index of MinHash signatures for finding near-duplicate resumes.
+
+    Signatures are split into ``LSH_BANDS`` bands and each band is hashed
+    into a bucket table, so a lookup only compares against resumes sharing
+    at least one band instead of scanning the index. Entries are appended to
+    ``signatures.jsonl``, which every worker process shares: each applies the
+    entries other workers appended before a lookup (see ``OperationLog``).
+    """
+
+    def __init__(self, index_dir='data/near_duplicates', threshold=NEAR_DUPLICATE_THRESHOLD):
+        self.index_dir = index_dir
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._entries = {}      # resume id -> (signature, path)
+        self._buckets = [{} for _ in range(LSH_BANDS)]
+        os.makedirs(self.index_dir, exist_ok=True)
+        self._log = OperationLog(self._path())
+        self._sync()
+
+    def __len__(self):
+        with self._lock:
+            self._sync()
+            return len(self._entries)
+
+    def __contains__(self, resume_id):
+        with self._lock:
+            self._sync()
+            return resume_id in self._entries
+
+    def add(self, resume_id, signature, path=None):
+        signature = np.asarray(signature, dtype=np.uint32)
+        with self._lock, self._log.locked(exclusive=True):
+            self._catch_up()
+            if resume_id in self._entries:
+                return
+            self._insert(resume_id, signature, path)
+            self._log.append({'id': resume_id, 'path': path, 'signature': signature.tolist()})
+
+    def find(self, signature, exclude=None):
+        """Return the most similar indexed resume above the threshold, or None."""
+        signature = np.asarray(signature, dtype=np.uint32)
+        with self._lock:
+            self._sync()
+            candidates = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(key, ()))
+            candidates.discard(exclude)
+
+            best = None
+            for resume_id in candidates:
+                other, path = self._entries[resume_id]
+                similarity = estimate_similarity(signature, other)
+                if similarity >= self.threshold and (best is None or similarity > best['similarity']):
+                    best = {'resume_id': resume_id, 'resume_path': path, 'similarity': similarity}
+            return best
+
+    def _band_keys(self, signature):
+        rows = len(signature) // LSH_BANDS
+        return [signature[band * rows:(band + 1) * rows].tobytes() for band in range(LSH_BANDS)]
+
+    def _insert(self, resume_id, signature, path):
+        self._entries[resume_id] = (signature, path)
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(resume_id)
+
+    def _path(self):
+        return os.path.join(self.index_dir, 'signatures.jsonl')
+
+    def _catch_up(self):
+        """Insert signatures other processes appended since the last call."""
+        # The log is never rotated, so there is no snapshot to reload
+        _, entries = self._log.read_new()
+        for entry in entries:
+            if entry['id'] not in self._entries:
+                self._insert(entry['id'], np.asarray(entry['signature'], dtype=np.uint32), entry['path'])
+
+    def _sync(self):
+        with self._log.locked():
+            self._catch_up()
@@ -0,0 +1,83 @@
+import threading
+import time
+from .utils.nlp_utils import NLPProcessor
+
+
+class NLPService:
+    """Process-wide, lazily initialized NLPProcessor shared by all components.
+
+    The processor (and the models it loads) is created once, on first use or
+    on an explicit ``warm_up()``, under a lock so concurrent requests never
+    load it twice. ``is_ready()`` lets readiness checks hold traffic until the
+    models are in memory.
+    """
+
+    def __init__(self, factory=NLPProcessor):
+        self._factory = factory
+        self._processor = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._error = None
+        self._load_seconds = None
+
+    @property
+    def processor(self):
+        if self._processor is None:
+            with self._lock:
+                if self._processor is None:
+                    self._processor = self._load()
+        return self._processor
+
+    def _load(self):
+        print("Loading NLP models...")
+        start = time.perf_counter()
+        try:
+            processor = self._factory()
+            # Exercise the processor once so lazily loaded models are resident
+            processor.analyze_sentiment("Warm up the NLP pipeline.")
+        except Exception as e:
+            self._error = str(e)
+            print(f"Error loading NLP models: {e}")
+            raise
+        self._load_seconds = round(time.perf_counter() - start, 3)
+        self._error = None
+        self._ready.set()
+        print(f"NLP models loaded in {self._load_seconds}s.")
+        return processor
+
+    def warm_up(self):
+        """Load the models now instead of on the first request."""
+        return self.processor
+
+    def warm_up_async(self):
+        """Load the models on a background thread."""
+        def run():
+            try:
+                self.warm_up()
+            except Exception:
+                pass  # Reported through status()
+
+        thread = threading.Thread(target=run, name='nlp-warm-up', daemon=True)
+        thread.start()
+        return thread
+
+    def is_ready(self):
+        return self._ready.is_set()
+
+    def wait_until_ready(self, timeout=None):
+        return self._ready.wait(timeout)
+
+    def status(self):
+        return {
+            'ready': self.is_ready(),
+            'load_seconds': self._load_seconds,
+            'error': self._error
+        }
+
+
+_shared_service = NLPService()
+
+
+def get_nlp_service():
+    """Return the process-wide NLPService."""
+    return _shared_service
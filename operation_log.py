@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; only the single-process dev server runs there
+    fcntl = None
+
+
+class OperationLog:
+    """Append-only JSON-lines log shared by every process that uses a store.
+
+    Each gunicorn worker keeps its own in-memory copy of a store, so the log
+    on disk is the source of truth. Writers append under an exclusive
+    ``flock`` on ``<log>.lock`` after catching up; readers take a shared lock
+    and call ``read_new()`` to apply whatever other processes appended since
+    their last call. When a snapshot has absorbed the log, ``rotate()``
+    replaces it with an empty log of the next generation; a process that
+    sees the generation change reloads the snapshot instead of tailing.
+
+    Not thread-safe on its own: the owning store serializes its threads
+    (it holds its lock around every call).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock_path = path + '.lock'
+        self._held = None           # 'shared' or 'exclusive' while locked
+        self._generation = None
+        self._offset = 0
+        self._signature = None      # stat of the log when it was last read
+        self.operations = 0         # operations in the current generation
+
+    @contextmanager
+    def locked(self, exclusive=False):
+        """Hold the cross-process lock; re-entering from inside a lock is a no-op."""
+        if self._held is not None:
+            if exclusive and self._held != 'exclusive':
+                raise RuntimeError("Cannot upgrade a shared operation log lock")
+            yield
+            return
+        mode = 'exclusive' if exclusive else 'shared'
+        if fcntl is None:
+            self._held = mode
+            try:
+                yield
+            finally:
+                self._held = None
+            return
+        with open(self._lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            self._held = mode
+            try:
+                yield
+            finally:
+                self._held = None
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _parse_header(line):
+        # Logs written before generations existed have no header: generation 0
+        try:
+            header = json.loads(line)
+        except ValueError:
+            return 0, 0
+        if isinstance(header, dict) and list(header) == ['generation']:
+            return header['generation'], len(line)
+        return 0, 0
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def read_new(self):
+        """Return ``(reset, operations)`` appended since the previous call.
+
+        ``reset`` means the log was rotated since then: the caller must drop
+        its in-memory state and reload the snapshot before applying
+        ``operations``, which are then the whole new log.
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False, []
+
+        operations = []
+        with open(self.path, 'rb') as f:
+            generation, header_length = self._parse_header(f.readline())
+            reset = self._generation is not None and generation != self._generation
+            if reset or self._generation is None:
+                self._generation = generation
+                self._offset = header_length
+                self.operations = 0
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Torn write from a crashed writer; append() terminates it
+                self._offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    operations.append(json.loads(line))
+                except ValueError:
+                    continue
+        self._signature = signature
+        self.operations += len(operations)
+        return reset, operations
+
+    def append(self, operation):
+        """Append one operation; the caller holds the exclusive lock and has caught up."""
+        with open(self.path, 'ab+') as f:
+            if f.tell() == 0:
+                generation = self._generation or 0
+                f.write((json.dumps({'generation': generation}) + '\n').encode('utf-8'))
+                self._generation = generation
+            else:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')  # Terminate a torn line so this one parses
+            f.write((json.dumps(operation) + '\n').encode('utf-8'))
+            self._offset = f.tell()
+        self._signature = self._stat()
+        self.operations += 1
+
+    def rotate(self):
+        """Start an empty next generation; the caller holds the exclusive lock."""
+        self._generation = (self._generation or 0) + 1
+        header = (json.dumps({'generation': self._generation}) + '\n').encode('utf-8')
+        directory = os.path.dirname(self.path) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.jsonl')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+        os.replace(tmp_path, self.path)
+        self._offset = len(header)
+        self._signature = self._stat()
+        self.operations = 0
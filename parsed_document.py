@@ -0,0 +1,45 @@
+from functools import cached_property
+
+from .resume_sections import section_text, segment_sections
+
+
+class ParsedDocument(str):
+    """Document text with memoized section offsets and extractor results.
+
+    A ParsedDocument is a ``str``, so it can be handed to any NLPProcessor
+    method that takes raw text. Sections are found once on first access and
+    ``derive`` memoizes whole extractor results, so every component holding
+    the same document (see ``DocumentCache.get_document``) reuses them.
+    """
+
+    def __new__(cls, text):
+        if isinstance(text, cls):
+            return text
+        return super().__new__(cls, text or "")
+
+    @property
+    def text(self):
+        return str(self)
+
+    @cached_property
+    def sections(self):
+        """Resume section offsets, found in one pass over the text."""
+        return segment_sections(self.text)
+
+    def section(self, *names, body_only=False):
+        """Text of the named sections, or None when the document has none of them."""
+        return section_text(self.text, self.sections, names, body_only=body_only)
+
+    @cached_property
+    def _derived(self):
+        return {}
+
+    def derive(self, name, compute):
+        """Return ``compute(self)``, computing it at most once per document."""
+        if name not in self._derived:
+            self._derived[name] = compute(self)
+        return self._derived[name]
+
+    def __reduce__(self):
+        # Pickle as plain text; the memoized views are rebuilt on demand
+        return (self.__class__, (self.text,))
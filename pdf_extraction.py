@@ -0,0 +1,18 @@
+from PyPDF2 import PdfReader
+
+
+def open_pdf(file):
+    """Open a PDF for page-by-page extraction."""
+    return PdfReader(file)
+
+
+def iter_pdf_pages(reader, start=0, stop=None):
+    """Yield ``(index, text)`` for pages ``[start, stop)`` as each is extracted.
+
+    Only one page's text is held at a time, so callers can stream pages
+    onwards or stop early when they only need the top of the document.
+    """
+    page_count = len(reader.pages)
+    stop = page_count if stop is None else min(stop, page_count)
+    for index in range(start, stop):
+        yield index, reader.pages[index].extract_text() or ""
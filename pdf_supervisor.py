@@ -0,0 +1,308 @@
+import multiprocessing
+import multiprocessing.connection
+import os
+import threading
+import time
+from .pdf_extraction import iter_pdf_pages, open_pdf
+from .utils.file_utils import read_file_content
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Per-document budgets
+PARSE_TIMEOUT_SECONDS = 20
+PARSE_MEMORY_LIMIT_BYTES = 512 * 1024 * 1024
+# Recycle a worker after this many documents so leaks cannot accumulate
+MAX_DOCUMENTS_PER_WORKER = 50
+WORKER_POOL_SIZE = 2
+POLL_INTERVAL_SECONDS = 0.05
+# Documents with at least this many pages are split across idle workers
+PARALLEL_PAGE_THRESHOLD = 8
+PAGES_PER_CHUNK = 4
+
+
+class PdfParseError(Exception):
+    """Raised when a PDF cannot be parsed within its budget.
+
+    ``code`` is one of ``timeout``, ``memory``, ``worker_crashed`` or
+    ``parse_error``.
+    """
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+    def to_dict(self):
+        return {'error': self.message, 'code': self.code}
+
+
+def _worker_main(conn, memory_limit):
+    """Parse PDFs sent over ``conn`` until told to stop."""
+    if resource is not None and memory_limit:
+        # Hard cap on address space growth beyond what was inherited from the
+        # parent; the parent separately watches the worker's private memory
+        inherited = _memory_usage(os.getpid())[0] or 0
+        limit = inherited + 2 * memory_limit
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    # The parent charges each parse only for growth past this baseline
+    conn.send(('ready', _memory_usage(os.getpid())[1]))
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+
+        pdf_path, start, stop = request
+        try:
+            # The page count goes first so the parent can plan the rest of the
+            # document, then each page is sent as soon as it is extracted
+            with open(pdf_path, 'rb') as file:
+                reader = open_pdf(file)
+                conn.send(('page_count', len(reader.pages)))
+                for page in iter_pdf_pages(reader, start, stop):
+                    conn.send(('page', page))
+            conn.send(('done', None))
+        except MemoryError:
+            conn.send(('memory', 'PDF parsing exceeded its memory budget'))
+        except Exception as e:
+            conn.send(('parse_error', f"Failed to extract text from PDF: {e}"))
+
+
+def _memory_usage(pid):
+    """Return ``(virtual, private)`` bytes for a process.
+
+    Private memory is ``Private_Clean + Private_Dirty`` from smaps_rollup:
+    pages mapped by this process alone. Pages a forked worker still shares
+    copy-on-write with its parent are not counted, whether file-backed or
+    anonymous. Either value is None where /proc cannot report it.
+    """
+    virtual = private = None
+    try:
+        with open(f'/proc/{pid}/statm', 'r') as f:
+            virtual = int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', 'r') as f:
+            private = sum(int(line.split()[1]) * 1024 for line in f
+                          if line.startswith(('Private_Clean:', 'Private_Dirty:')))
+    except (OSError, ValueError):
+        pass
+    return virtual, private
+
+
+class _Worker:
+    def __init__(self, memory_limit):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.documents = 0
+        self.baseline = None    # private bytes when the worker started
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class PdfParseSupervisor:
+    """Runs PDF parsing in supervised worker processes.
+
+    Each document gets a wall-clock budget, and every worker parsing it a
+    budget for private memory grown since the worker started. A parse that goes over either is cancelled by killing its
+    workers, and the caller gets a ``PdfParseError``. Workers send pages back
+    as they extract them, and long documents are split into page chunks
+    across the workers the pool has free. Workers are replaced after
+    ``max_documents`` parses so slow leaks in the PDF library cannot build up.
+    """
+
+    def __init__(self, timeout=PARSE_TIMEOUT_SECONDS, memory_limit=PARSE_MEMORY_LIMIT_BYTES,
+                 max_documents=MAX_DOCUMENTS_PER_WORKER, pool_size=WORKER_POOL_SIZE):
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_documents = max_documents
+        self._idle = []
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()
+
+    def parse(self, pdf_path, max_pages=None):
+        """Return the text of a PDF, or of its first ``max_pages``, or raise PdfParseError."""
+        return "".join(list(self.iter_pages(pdf_path, max_pages)))
+
+    def iter_pages(self, pdf_path, max_pages=None):
+        """Yield the text of each page in order as the workers extract it.
+
+        The first chunk of pages goes to one worker, which also reports the
+        page count. Documents of ``PARALLEL_PAGE_THRESHOLD`` pages or more
+        have the rest split into ``PAGES_PER_CHUNK`` chunks across as many
+        extra workers as the pool has free; shorter ones continue on the same
+        worker. Nothing past ``max_pages`` is parsed, and closing the
+        generator early stops its workers. Raises PdfParseError.
+        """
+        pdf_path = os.path.abspath(pdf_path)
+        first_stop = PAGES_PER_CHUNK if max_pages is None else min(PAGES_PER_CHUNK, max_pages)
+        chunks = [(0, first_stop)]
+        pages = {}                  # page index -> text, until it is yielded
+        next_page = 0
+        planned = False
+        extra_slots = 0
+        idle, busy = [], {}         # busy: connection -> worker
+        deadline = time.monotonic() + self.timeout
+
+        with self._slots:
+            try:
+                idle.append(self._acquire())
+                while chunks or busy:
+                    while idle and chunks:
+                        worker = idle.pop()
+                        self._send(worker, (pdf_path, *chunks.pop(0)))
+                        busy[worker.conn] = worker
+
+                    for conn in multiprocessing.connection.wait(list(busy), POLL_INTERVAL_SECONDS):
+                        worker = busy[conn]
+                        kind, payload = self._receive(worker)
+                        if kind == 'page':
+                            pages[payload[0]] = payload[1]
+                        elif kind == 'done':
+                            del busy[conn]
+                            idle.append(worker)
+                        elif kind == 'ready':
+                            worker.baseline = payload
+                        elif kind != 'page_count':
+                            raise PdfParseError(kind, payload)
+                        elif not planned:
+                            planned = True
+                            end = payload if max_pages is None else min(payload, max_pages)
+                            chunks = self._remaining_chunks(first_stop, end, payload)
+                            while extra_slots < len(chunks) and self._slots.acquire(blocking=False):
+                                extra_slots += 1
+                                idle.append(self._acquire())
+
+                    self._check_budgets(busy.values(), deadline)
+                    while next_page in pages:
+                        yield pages.pop(next_page)
+                        next_page += 1
+            finally:
+                # Workers still mid-chunk have unread pages in their pipes
+                for worker in busy.values():
+                    worker.kill()
+                for worker in idle:
+                    self._release(worker)
+                for _ in range(extra_slots):
+                    self._slots.release()
+
+    @staticmethod
+    def _remaining_chunks(start, end, page_count):
+        """Page ranges left after the first chunk, split up for long documents."""
+        if start >= end:
+            return []
+        if page_count < PARALLEL_PAGE_THRESHOLD:
+            return [(start, end)]
+        return [(chunk, min(chunk + PAGES_PER_CHUNK, end))
+                for chunk in range(start, end, PAGES_PER_CHUNK)]
+
+    def _send(self, worker, request):
+        try:
+            worker.conn.send(request)
+        except OSError:
+            worker.kill()
+            raise PdfParseError('worker_crashed', 'PDF parser exited unexpectedly')
+
+    def _receive(self, worker):
+        try:
+            return worker.conn.recv()
+        except (EOFError, OSError):
+            raise PdfParseError('worker_crashed', 'PDF parser exited unexpectedly')
+
+    def _check_budgets(self, workers, deadline):
+        if time.monotonic() > deadline:
+            raise PdfParseError('timeout', f'PDF parsing exceeded {self.timeout}s time budget')
+        for worker in workers:
+            if not worker.is_alive():
+                raise PdfParseError('worker_crashed', 'PDF parser exited unexpectedly')
+            private = _memory_usage(worker.process.pid)[1]
+            if (self.memory_limit and private is not None
+                    and private - (worker.baseline or 0) > self.memory_limit):
+                raise PdfParseError('memory', 'PDF parsing exceeded its memory budget')
+
+    def _acquire(self):
+        """An idle or new worker, counting the document it is about to parse."""
+        worker = None
+        with self._lock:
+            while self._idle and worker is None:
+                worker = self._idle.pop()
+                if not worker.is_alive():
+                    worker.kill()
+                    worker = None
+        worker = worker or _Worker(self.memory_limit)
+        worker.documents += 1
+        return worker
+
+    def _release(self, worker):
+        if not worker.is_alive():
+            return
+        if worker.documents >= self.max_documents:
+            worker.stop()
+            return
+        with self._lock:
+            self._idle.append(worker)
+
+    def shutdown(self):
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.stop()
+
+
+_shared_supervisor = None
+_shared_supervisor_lock = threading.Lock()
+
+
+def get_pdf_supervisor():
+    """Return the process-wide PdfParseSupervisor."""
+    global _shared_supervisor
+    if _shared_supervisor is None:
+        with _shared_supervisor_lock:
+            if _shared_supervisor is None:
+                _shared_supervisor = PdfParseSupervisor()
+    return _shared_supervisor
+
+
+def _reset_after_fork():
+    # Workers belong to the parent; a forked child starts its own
+    global _shared_supervisor
+    _shared_supervisor = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def load_document_text(filepath):
+    """Read a document's text; PDFs are parsed under the supervisor's budget."""
+    if filepath.lower().endswith('.pdf'):
+        return get_pdf_supervisor().parse(filepath)
+    return read_file_content(filepath)
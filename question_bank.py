@@ -0,0 +1,210 @@
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from .cache import LRUCache
+
+QUESTION_SOURCE_PATH = 'data/interview_questions.json'
+QUESTION_BANK_DIR = 'data/question_bank'
+# Bump when the compiled layout changes so old builds are recompiled
+QUESTION_BANK_FORMAT = 3
+
+
+def question_text_hash(role, level, question_text):
+    """Short hash identifying a question by its text within a role and level."""
+    key = f"{role}\n{level}\n{question_text}".encode('utf-8')
+    return hashlib.sha256(key).hexdigest()[:16]
+
+
+def _source_hash(source_path):
+    sha256 = hashlib.sha256()
+    with open(source_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def compile_question_bank(source_path=QUESTION_SOURCE_PATH, bank_dir=QUESTION_BANK_DIR):
+    """Compile the editable question file into the indexed bank.
+
+    ``questions.jsonl`` holds one question per line, grouped so every
+    (role, level, focus) is one contiguous byte range; ``index.json`` maps
+    each group to its ``[offset, length, count]``, each question ID to its
+    ``[offset, length, role, level, focus, row]`` (``row`` is the line
+    number, for tables kept alongside the bank) and each question text hash
+    to its ID. Questions keep the ``id`` given in the source; one without an ID
+    gets its text hash. Both files are written to temporary files and swapped
+    in, index last.
+    """
+    with open(source_path, 'r', encoding='utf-8') as f:
+        source = json.load(f)
+
+    os.makedirs(bank_dir, exist_ok=True)
+    groups = {}
+    question_offsets = {}
+    text_ids = {}
+    count = 0
+    fd, questions_tmp = tempfile.mkstemp(dir=bank_dir, suffix='.jsonl')
+    with os.fdopen(fd, 'wb') as out:
+        offset = 0
+        for role, levels in source.items():
+            for level, focuses in levels.items():
+                for focus, questions in focuses.items():
+                    start = offset
+                    for question in questions:
+                        text_hash = question_text_hash(role, level, question['question'])
+                        question = {'id': question.get('id', text_hash), **question}
+                        if question['id'] in question_offsets:
+                            raise ValueError(f"Duplicate interview question ID {question['id']}")
+                        line = (json.dumps(question, ensure_ascii=False) + '\n').encode('utf-8')
+                        out.write(line)
+                        question_offsets[question['id']] = [offset, len(line), role, level, focus, count]
+                        text_ids[text_hash] = question['id']
+                        offset += len(line)
+                        count += 1
+                    groups.setdefault(role, {}).setdefault(level, {})[focus] = [
+                        start, offset - start, len(questions)
+                    ]
+
+    index = {
+        'format': QUESTION_BANK_FORMAT,
+        'source_hash': _source_hash(source_path),
+        'count': count,
+        'groups': groups,
+        'questions': question_offsets,
+        'text_ids': text_ids
+    }
+    fd, index_tmp = tempfile.mkstemp(dir=bank_dir, suffix='.json')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(index, f)
+    os.replace(questions_tmp, os.path.join(bank_dir, 'questions.jsonl'))
+    os.replace(index_tmp, os.path.join(bank_dir, 'index.json'))
+    print(f"Compiled {count} interview questions into {bank_dir}")
+    return index
+
+
+class QuestionBank:
+    """Read-only interview question bank backed by the compiled files.
+
+    Only the small group index is read at startup. ``questions.jsonl`` is
+    memory-mapped, so its pages live in the OS page cache and are shared by
+    every worker process; a (role, level, focus) group is parsed the first
+    time it is asked for and kept in a bounded LRU, so heap use follows the
+    groups actually in use rather than the size of the bank.
+    """
+
+    def __init__(self, bank_dir=QUESTION_BANK_DIR, source_path=QUESTION_SOURCE_PATH,
+                 max_cached_groups=64):
+        self.bank_dir = bank_dir
+        self.source_path = source_path
+        self._groups = LRUCache(max_entries=max_cached_groups)
+        self._questions = LRUCache(max_entries=max_cached_groups * 16)
+        self._mmap = None
+        self._mmap_lock = threading.Lock()
+        self.index = self._load_index()
+
+    def _load_index(self):
+        index_path = os.path.join(self.bank_dir, 'index.json')
+        index = None
+        if os.path.exists(index_path):
+            with open(index_path, 'r') as f:
+                index = json.load(f)
+
+        # Recompile when the editable source has changed since the last build
+        if os.path.exists(self.source_path):
+            stale = (index is None
+                     or index.get('format') != QUESTION_BANK_FORMAT
+                     or index.get('source_hash') != _source_hash(self.source_path))
+            if stale:
+                index = compile_question_bank(self.source_path, self.bank_dir)
+        if index is None:
+            raise FileNotFoundError(f"No interview question bank in {self.bank_dir}")
+        return index
+
+    def _get_mmap(self):
+        if self._mmap is None:
+            with self._mmap_lock:
+                if self._mmap is None:
+                    with open(os.path.join(self.bank_dir, 'questions.jsonl'), 'rb') as f:
+                        self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def __len__(self):
+        return self.index['count']
+
+    def roles(self):
+        return list(self.index['groups'])
+
+    def levels(self, role):
+        return list(self.index['groups'].get(role, {}))
+
+    def focuses(self, role, level):
+        return list(self.index['groups'].get(role, {}).get(level, {}))
+
+    def questions(self, role, level, focus):
+        """All questions for a (role, level, focus), or an empty list."""
+        entry = self.index['groups'].get(role, {}).get(level, {}).get(focus)
+        if entry is None:
+            return []
+        key = (role, level, focus)
+        questions = self._groups.get(key)
+        if questions is None:
+            offset, length, _ = entry
+            data = self._get_mmap()[offset:offset + length]
+            questions = [json.loads(line) for line in data.decode('utf-8').splitlines()]
+            self._groups.put(key, questions)
+        return questions
+
+    def all_questions(self):
+        """Iterate over every question in the bank, group by group."""
+        for role, levels in self.index['groups'].items():
+            for level, focuses in levels.items():
+                for focus in focuses:
+                    yield from self.questions(role, level, focus)
+
+    def get(self, question_id, role=None, level=None):
+        """Look a question up by ID, optionally requiring its role and level."""
+        entry = self.index['questions'].get(question_id)
+        if entry is None:
+            return None
+        offset, length, question_role, question_level, _, _ = entry
+        if role is not None and role != question_role:
+            return None
+        if level is not None and level != question_level:
+            return None
+        question = self._questions.get(question_id)
+        if question is None:
+            question = json.loads(self._get_mmap()[offset:offset + length])
+            self._questions.put(question_id, question)
+        return question
+
+    def row(self, question_id):
+        """Line number of a question in ``questions.jsonl``, or None."""
+        entry = self.index['questions'].get(question_id)
+        return entry[5] if entry else None
+
+    def id_for_text(self, question_text, role, level):
+        return self.index['text_ids'].get(question_text_hash(role, level, question_text))
+
+    def find(self, question_text, role, level):
+        """Look a question up by its text within a role and level."""
+        question_id = self.id_for_text(question_text, role, level)
+        if question_id is None:
+            return None
+        return self.get(question_id, role, level)
+
+
+_shared_bank = None
+_shared_bank_lock = threading.Lock()
+
+
+def get_question_bank():
+    """Return the process-wide QuestionBank, opening it on first use."""
+    global _shared_bank
+    if _shared_bank is None:
+        with _shared_bank_lock:
+            if _shared_bank is None:
+                _shared_bank = QuestionBank()
+    return _shared_bank
@@ -1,34 +1,132 @@
-from .utils.file_utils import read_file_content
-from .utils.nlp_utils import NLPProcessor
-import json
+from .nlp_service import get_nlp_service
+from .document_cache import DocumentCache
+from .cache import TwoTierCache
+from .parsed_document import ParsedDocument
+from .skill_matcher import get_skill_matcher
+from .similarity import build_similarity_model, get_similarity_engine, has_similarity_model
+from .resume_index import ResumeIndex
+from .job_store import JobStore
+from .job_description import get_job_description_cache
+from .near_duplicates import NearDuplicateIndex, minhash_signature
+from .resume_sections import section_hash
+from .resume_entries import extract_education_entries, extract_experience_entries
+from .pdf_supervisor import PdfParseError, get_pdf_supervisor, load_document_text
 import os
 import time
-from PyPDF2 import PdfReader
 import re
+import numpy as np
+from scipy import sparse
 # from pdfminer.pdfparser import PdfParser
 # from pdfminer.pdfdocument import PdfDocument
 # from pdfminer.pdfpage import PdfPage
 # from pdfminer.pdfinterp import PdfInterpreter
 # from pdfminer.pdfdevice import PdfDevice
 
+# Bump when analysis output changes so stale cache entries are not reused
+ANALYZER_VERSION = 6
+
+# Document artifacts produced by the analyzer's own extractors carry its version
+ARTIFACT_VERSIONS = {
+    'resume_data': ANALYZER_VERSION,
+    'taxonomy_skills': ANALYZER_VERSION
+}
+
+# Resume sections each extractor reads; the whole text is used when a resume
+# has none of them
+CONTACT_SECTIONS = ('header',)
+# Name and summary are read from this many leading pages when the full
+# text has not been extracted yet
+HEADER_PAGES = 1
+SKILL_SECTIONS = ('summary', 'skills', 'experience', 'projects', 'certifications')
+EXTRACTOR_SECTIONS = {
+    'skills': SKILL_SECTIONS,
+    'education': ('education', 'certifications'),
+    'experience': ('experience', 'projects')
+}
+
+# Sections update_resume renders, and the resume_data fields each one shows
+RENDERED_SECTIONS = {
+    'header': ('name', 'email', 'phone'),
+    'summary': ('summary',),
+    'skills': ('skills',),
+    'experience': ('experience',),
+    'education': ('education',)
+}
+# Sections each derived result reads (None: the whole text). After an edit a
+# result is copied to the updated PDF only when the new PDF renders exactly
+# those sections again, unchanged; the rest are computed from it on demand
+ARTIFACT_DEPENDENCIES = {
+    'taxonomy_skills': SKILL_SECTIONS,
+    'keywords': None
+}
+ANALYSIS_DEPENDENCIES = {
+    'skills': SKILL_SECTIONS,
+    'education': EXTRACTOR_SECTIONS['education'],
+    'experience': EXTRACTOR_SECTIONS['experience'],
+    'keywords': None,
+    'sentiment_score': None
+}
+
 class ResumeAnalyzer:
-    def __init__(self):
-        self.nlp_processor = NLPProcessor()
+    def __init__(self, document_cache=None, skill_matcher=None, nlp_service=None,
+                 resume_index=None, job_store=None, similarity_engine=None,
+                 job_description_cache=None, near_duplicate_index=None):
+        self.nlp_service = nlp_service or get_nlp_service()
+        self.document_cache = document_cache or DocumentCache()
+        self.skill_matcher = skill_matcher or get_skill_matcher()
         self.cache_dir = 'cache/resume_analysis'
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.analysis_cache = TwoTierCache(
+            self.cache_dir,
+            max_entries=256,
+            max_bytes=64 * 1024 * 1024,
+            ttl=7 * 24 * 3600
+        )
+        # Extractor results per section, keyed by section text, so a resume
+        # that differs from an earlier one in a few sections only re-runs those
+        self.section_cache = TwoTierCache(
+            'cache/resume_sections',
+            max_entries=1024,
+            max_bytes=64 * 1024 * 1024,
+            ttl=7 * 24 * 3600
+        )
+        self.near_duplicates = (near_duplicate_index if near_duplicate_index is not None
+                                else NearDuplicateIndex())
+        # Compared with None: an empty index is falsy because it has a length
+        self.resume_index = (resume_index if resume_index is not None
+                             else ResumeIndex(similarity_engine=similarity_engine))
+        # Parsed job descriptions are shared by matching, gap analysis and the job store
+        self.job_description_cache = job_description_cache or get_job_description_cache()
+        self.job_store = job_store if job_store is not None else JobStore(
+            job_description_cache=self.job_description_cache,
+            similarity_engine=similarity_engine
+        )
+        self._similarity_engine = similarity_engine
+
+    @property
+    def nlp_processor(self):
+        return self.nlp_service.processor
+
+    @property
+    def similarity_engine(self):
+        # Unweighted until a similarity model has been built
+        return self._similarity_engine or get_similarity_engine()
 
     def analyze(self, filepath):
         """Analyze a resume and extract key information."""
+        cached = self.get_cached_analysis(filepath)
+        if cached is not None:
+            return cached
+
         # Read resume content
-        content = read_file_content(filepath)
+        document = self._get_document(filepath)
         
-        # Extract information using NLP
+        # Extract information using NLP; every pass shares the document's tokens
         analysis = {
-            'skills': self.nlp_processor.extract_skills(content),
-            'education': self.nlp_processor.extract_education(content),
-            'experience': self.nlp_processor.extract_experience(content),
-            'keywords': self.nlp_processor.extract_keywords(content),
-            'sentiment_score': self.nlp_processor.analyze_sentiment(content)
+            'skills': self._get_resume_skills(filepath, document),
+            'education': self._get_section_sentences(document, 'education'),
+            'experience': self._get_section_sentences(document, 'experience'),
+            'keywords': self.get_keywords(filepath, document),
+            'sentiment_score': document.derive('sentiment', self.nlp_processor.analyze_sentiment)
         }
         
         # Cache the analysis
@@ -36,21 +134,148 @@ class ResumeAnalyzer:
         
         return analysis
 
+    def find_near_duplicate(self, resume_path):
+        """Register a resume's MinHash signature and return its closest earlier near-duplicate."""
+        resume_id = self.document_cache.file_hash(resume_path)
+        signature = self.document_cache.get_artifact(
+            resume_path, 'minhash',
+            lambda: minhash_signature(self._get_document(resume_path)).tolist()
+        )
+        match = self.near_duplicates.find(signature, exclude=resume_id)
+        self.near_duplicates.add(resume_id, signature, path=os.path.abspath(resume_path))
+        return match
+
+    def _relevant_sections(self, document, names):
+        """The ``(name, text)`` sections an extractor should read."""
+        sections = [(section.name, document[section.start:section.end])
+                    for section in document.sections if section.name in names]
+        return sections or [('document', document.text)]
+
+    def _section_slice(self, text, names):
+        """Joined text of the named sections, or the whole text if there are none."""
+        document = ParsedDocument(text)
+        return document.section(*names) or document.text
+
+    def _extract_by_section(self, text, name, extract):
+        """Run ``extract`` on each relevant section of a resume, reusing cached section results."""
+        document = ParsedDocument(text)
+        results = []
+        for _, body in self._relevant_sections(document, EXTRACTOR_SECTIONS[name]):
+            key = f"{section_hash(body)}-v{ANALYZER_VERSION}"
+            entry = self.section_cache.get(key, {})
+            if name not in entry:
+                entry = dict(entry, **{name: extract(body)})
+                self.section_cache.put(key, entry)
+            results.append(entry[name])
+        return results
+
+    def _get_section_sentences(self, document, name):
+        """Education or experience sentences, extracted section by section."""
+        extract = getattr(self.nlp_processor, f'extract_{name}')
+        return document.derive(name, lambda d: [
+            sentence
+            for sentences in self._extract_by_section(d, name, extract)
+            for sentence in sentences
+        ])
+
+    def get_keywords(self, filepath, document=None):
+        """Return a resume's keywords, cached by content hash."""
+        document = document or self._get_document(filepath)
+        return self.document_cache.get_artifact(
+            filepath, 'keywords',
+            lambda: document.derive('keywords', self.nlp_processor.extract_keywords)
+        )
+
     def calculate_match_score(self, resume_path, job_description):
         """Calculate how well the resume matches a job description."""
         # Read both documents
-        resume_content = read_file_content(resume_path)
+        resume_document = self._get_document(resume_path)
+        job = self.job_description_cache.parse(job_description)
+        job_document = job.document
         
-        # Calculate similarity
-        similarity_score = self.nlp_processor.calculate_similarity(
-            resume_content,
-            job_description
-        )
+        # Calculate similarity; batch scoring, the resume index and the job
+        # store use the same engine, so every path gives the same score
+        similarity_score = self.similarity_engine.similarity(resume_document, job_document)
         
         # Extract skills from both
-        resume_skills = set(self.nlp_processor.extract_skills(resume_content))
-        job_skills = set(self.nlp_processor.extract_skills(job_description))
+        resume_skills = set(self._get_resume_skills(resume_path, resume_document))
+        job_skills = set(job.skills)
+        
+        return self._build_match_result(similarity_score, resume_skills, job_skills)
+
+    def calculate_match_scores(self, resume_path, job_descriptions):
+        """Score one resume against many job descriptions, best match first."""
+        # The resume is parsed and its skills extracted once for the whole batch
+        resume_document = self._get_document(resume_path)
+        resume_skills = set(self._get_resume_skills(resume_path, resume_document))
+        
+        # One sparse matrix product gives the similarity to every job description
+        similarity_scores = self.similarity_engine.one_vs_many(resume_document, job_descriptions)
         
+        results = []
+        for index, (job_description, similarity_score) in enumerate(
+                zip(job_descriptions, similarity_scores)):
+            job_skills = set(self.job_description_cache.parse(job_description).skills)
+            result = self._build_match_result(similarity_score, resume_skills, job_skills)
+            result['job_index'] = index
+            results.append(result)
+        
+        results.sort(key=lambda r: r['overall_score'], reverse=True)
+        return results
+
+    def index_resume(self, resume_path):
+        """Add a resume's term vector and skills to the recruiter index."""
+        resume_id = self.document_cache.file_hash(resume_path)
+        if resume_id not in self.resume_index:
+            document = self._get_document(resume_path)
+            self.resume_index.add(
+                resume_id,
+                document,
+                self._get_resume_skills(resume_path, document),
+                path=os.path.abspath(resume_path)
+            )
+        return resume_id
+
+    def rank_resumes(self, job_description, top_k=50, required_skills=None):
+        """Rank every indexed resume against a job description."""
+        job = self.job_description_cache.parse(job_description)
+        if required_skills:
+            required_skills = [self.skill_matcher.canonicalize(skill) for skill in required_skills]
+        return self.resume_index.rank(
+            job.term_counts,
+            job.skills,
+            top_k=top_k,
+            required_skills=required_skills
+        )
+
+    def recommend_jobs(self, resume_path, top_k=10):
+        """Return the stored job descriptions that best match a resume."""
+        document = self._get_document(resume_path)
+        return self.job_store.top_jobs_for_resume(
+            document,
+            self._get_resume_skills(resume_path, document),
+            top_k=top_k
+        )
+
+    def build_similarity_model(self):
+        """Fit the IDF table over stored job descriptions and indexed resumes."""
+        # Both keep hashed term counts, so no document is re-read
+        counts = sparse.vstack([self.job_store.term_matrix(), self.resume_index.term_matrix()],
+                               format='csr')
+        engine = build_similarity_model(counts)
+        if self._similarity_engine is not None:
+            self._similarity_engine = engine
+        return {'documents': counts.shape[0], 'vocabulary_size': int(len(np.unique(counts.indices)))}
+
+    def prepare_similarity_model(self):
+        """Build the similarity model at startup if none is saved yet."""
+        if self._similarity_engine is None and not has_similarity_model():
+            if len(self.job_store) or len(self.resume_index):
+                print("Building similarity model...")
+                print(f"Similarity model built: {self.build_similarity_model()}")
+
+    def _build_match_result(self, similarity_score, resume_skills, job_skills):
+        """Combine text similarity and skill overlap into a match result."""
         # Calculate skill match
         if not job_skills:
             skill_match = 0
@@ -68,35 +293,46 @@ class ResumeAnalyzer:
             'missing_skills': list(job_skills - resume_skills)
         }
 
+    def _get_document(self, filepath):
+        """Return a resume as a ParsedDocument, shared through the document cache."""
+        return self.document_cache.get_document(filepath, load_document_text)
+
+    def _get_resume_skills(self, filepath, document):
+        """Return taxonomy skills found in a resume, cached by content hash."""
+        return self.document_cache.get_artifact(
+            filepath, 'taxonomy_skills',
+            lambda: document.derive('skills', self._extract_skills),
+            version=ARTIFACT_VERSIONS['taxonomy_skills']
+        )
+
+    def _analysis_key(self, filepath):
+        """Build a cache key from the file's content hash and analyzer version."""
+        return f"{self.document_cache.file_hash(filepath)}-v{ANALYZER_VERSION}"
+
     def _cache_analysis(self, filepath, analysis):
         """Cache the analysis results for future use."""
-        cache_file = os.path.join(
-            self.cache_dir,
-            f"{os.path.basename(filepath)}.json"
-        )
-        
-        with open(cache_file, 'w') as f:
-            json.dump(analysis, f)
+        self.analysis_cache.put(self._analysis_key(filepath), analysis)
 
     def get_cached_analysis(self, filepath):
         """Retrieve cached analysis if available."""
-        cache_file = os.path.join(
-            self.cache_dir,
-            f"{os.path.basename(filepath)}.json"
-        )
-        
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                return json.load(f)
-        return None
+        return self.analysis_cache.get(self._analysis_key(filepath))
+
+    def get_cache_stats(self):
+        """Report hit/miss/eviction counters for the resume caches."""
+        return {
+            'documents': self.document_cache.stats(),
+            'analysis': self.analysis_cache.stats(),
+            'sections': self.section_cache.stats(),
+            'job_descriptions': self.job_description_cache.stats()
+        }
 
     def get_skill_gaps(self, resume_path, job_description):
         """Identify skill gaps between resume and job description."""
-        resume_content = read_file_content(resume_path)
+        resume_document = self._get_document(resume_path)
         
         # Extract skills from both
-        resume_skills = set(self.nlp_processor.extract_skills(resume_content))
-        job_skills = set(self.nlp_processor.extract_skills(job_description))
+        resume_skills = set(self._get_resume_skills(resume_path, resume_document))
+        job_skills = set(self.job_description_cache.parse(job_description).skills)
         
         # Find missing and extra skills
         missing_skills = job_skills - resume_skills
@@ -110,8 +346,8 @@ class ResumeAnalyzer:
 
     def get_experience_summary(self, resume_path):
         """Generate a summary of work experience."""
-        content = read_file_content(resume_path)
-        experience = self.nlp_processor.extract_experience(content)
+        document = self._get_document(resume_path)
+        experience = self._get_section_sentences(document, 'experience')
         
         # Analyze experience for key achievements and responsibilities
         summary = {
@@ -135,36 +371,61 @@ class ResumeAnalyzer:
         return summary
 
     def _extract_text_from_pdf(self, pdf_path):
-        """Extract text from a PDF file."""
+        """Extract text from a PDF file, reusing the parsed-document cache."""
+        return self.document_cache.get_text(pdf_path, self._parse_pdf)
+
+    def _parse_pdf(self, pdf_path, max_pages=None):
+        """Parse a PDF file with PyPDF2 and return its text."""
         print(f"Attempting to extract text from PDF: {pdf_path}")
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PdfReader(file)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() or ""
+            # Parsing runs in supervised workers with time and memory budgets
+            text = get_pdf_supervisor().parse(pdf_path, max_pages=max_pages)
             print("Successfully extracted text from PDF.")
             return text
+        except PdfParseError as e:
+            print(f"Error extracting text from PDF {pdf_path}: {e.code}: {e}")
+            raise
         except Exception as e:
             print(f"Error extracting text from PDF {pdf_path}: {e}")
             raise Exception(f"Failed to extract text from PDF: {e}")
 
+    def extract_resume_header(self, resume_path):
+        """Extract name and summary, parsing only the first page if needed."""
+        text = self.document_cache.peek_artifact(resume_path, 'text')
+        if text is None:
+            if resume_path.lower().endswith('.pdf'):
+                text = self._parse_pdf(resume_path, max_pages=HEADER_PAGES)
+            else:
+                text = self._get_document(resume_path).text
+        
+        return {
+            'name': self._extract_name(text),
+            'summary': self._extract_summary(text)
+        }
+
     def _extract_name(self, text):
-        # Simple placeholder for name extraction
-        match = re.search(r"^[A-Z][a-z]+(?: [A-Z][a-z]+){1,3}", text)
+        # Simple placeholder for name extraction; the name sits in the header
+        match = re.search(r"^[A-Z][a-z]+(?: [A-Z][a-z]+){1,3}", self._section_slice(text, CONTACT_SECTIONS))
         return match.group(0) if match else ""
 
     def _extract_email(self, text):
         # Simple placeholder for email extraction
-        match = re.search(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", text)
+        pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+        match = re.search(pattern, self._section_slice(text, CONTACT_SECTIONS)) or re.search(pattern, text)
         return match.group(0) if match else ""
 
     def _extract_phone(self, text):
         # Simple placeholder for phone extraction
-        match = re.search(r"\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b", text)
+        pattern = r"\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"
+        match = re.search(pattern, self._section_slice(text, CONTACT_SECTIONS)) or re.search(pattern, text)
         return match.group(0) if match else ""
 
     def _extract_summary(self, text):
+        # Use the summary section when the resume has one
+        summary = ParsedDocument(text).section('summary', body_only=True)
+        if summary is not None:
+            return " ".join(line.strip() for line in summary.split('\n') if line.strip())
+        
         # Placeholder for summary extraction (e.g., first few sentences)
         lines = text.split('\n')
         summary_lines = []
@@ -176,49 +437,71 @@ class ResumeAnalyzer:
         return " ".join(summary_lines)
 
     def _extract_skills(self, text):
-        # Placeholder for skills extraction (simple keyword spotting)
-        skills_keywords = ["Python", "Java", "JavaScript", "SQL", "AWS", "Azure", "Docker", "Kubernetes", "React", "Angular", "Vue", "Machine Learning", "Data Analysis", "Project Management"]
-        found_skills = [skill for skill in skills_keywords if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE)]
-        return found_skills
+        # Single pass over each section for every skill in the shared taxonomy
+        skills = self._extract_by_section(text, 'skills', self.skill_matcher.find_skills)
+        found = {skill for section_skills in skills for skill in section_skills}
+        return [skill for skill in self.skill_matcher.skills if skill in found]
 
     def _extract_experience(self, text):
-        # Placeholder for experience extraction
-        experience_entries = []
-        # This is a very basic example; a more robust solution would involve NLP
-        return experience_entries
+        # Positions, companies and dates from the experience section
+        section = self._entry_section(text, 'experience')
+        return extract_experience_entries(section) if section else []
 
     def _extract_education(self, text):
-        # Placeholder for education extraction
-        education_entries = []
-        # This is a very basic example; a more robust solution would involve NLP
-        return education_entries
+        # Degrees, institutions and dates from the education section
+        section = self._entry_section(text, 'education')
+        return extract_education_entries(section) if section else []
+
+    def _entry_section(self, text, name):
+        """Body of a section, the whole text if the resume has no headings, else None."""
+        document = ParsedDocument(text)
+        section = document.section(name, body_only=True)
+        if section is None and all(s.name == 'header' for s in document.sections):
+            return document.text
+        return section
 
     def extract_resume_data(self, resume_path):
         """Extract resume data in an editable format."""
         print(f"Starting resume data extraction for: {resume_path}")
         try:
-            # Extract text from PDF
-            text = self._extract_text_from_pdf(resume_path)
-            print(f"Extracted text length: {len(text)}")
-            
-            # Extract structured data
-            data = {
-                'name': self._extract_name(text),
-                'email': self._extract_email(text),
-                'phone': self._extract_phone(text),
-                'summary': self._extract_summary(text),
-                'skills': self._extract_skills(text),
-                'experience': self._extract_experience(text),
-                'education': self._extract_education(text)
-            }
+            # Structured data is derived from the file contents, so it is
+            # cached alongside the extracted text
+            data = self.document_cache.get_artifact(
+                resume_path, 'resume_data',
+                lambda: self._build_resume_data(resume_path),
+                version=ARTIFACT_VERSIONS['resume_data']
+            )
             print("Successfully extracted structured data.")
             return data
+        except PdfParseError:
+            raise
         except Exception as e:
             print(f"Error in extract_resume_data: {e}")
             raise Exception(f"Error extracting resume data: {str(e)}")
 
-    def update_resume(self, resume_path, resume_data):
-        """Update resume with new data and generate a new PDF."""
+    def _build_resume_data(self, resume_path):
+        """Extract structured resume data from the PDF text."""
+        # Extract text from PDF
+        text = self._get_document(resume_path)
+        print(f"Extracted text length: {len(text)}")
+        
+        # Extract structured data; each extractor reads only its sections
+        return {
+            'name': self._extract_name(text),
+            'email': self._extract_email(text),
+            'phone': self._extract_phone(text),
+            'summary': self._extract_summary(text),
+            'skills': self._extract_skills(text),
+            'experience': self._extract_experience(text),
+            'education': self._extract_education(text)
+        }
+
+    def update_resume(self, resume_path, resume_data, on_stage=None):
+        """Update resume with new data and generate a new PDF.
+
+        ``on_stage(progress, stage)`` is called once the PDF is written and
+        the analysis update starts.
+        """
         try:
             # Create a new PDF with the updated data
             output_path = os.path.join(
@@ -280,11 +563,100 @@ class ResumeAnalyzer:
             
             # Build PDF
             doc.build(story)
+            if on_stage is not None:
+                on_stage(70, 'updating analysis')
+            
+            try:
+                # Results the edits did not touch are copied, not recomputed
+                self._carry_forward_analysis(resume_path, output_path, resume_data)
+            except Exception as e:
+                print(f"Could not carry analysis forward to {output_path}: {e}")
             
             return output_path
         except Exception as e:
             raise Exception(f"Error updating resume: {str(e)}")
 
+    def _carry_forward_analysis(self, resume_path, output_path, resume_data):
+        """Seed the updated PDF's caches and index entry without parsing it.
+
+        The submitted ``resume_data`` is stored for the new file directly. A
+        derived result is copied from the original only when every section it
+        read is rendered again with unchanged fields and no section it did not
+        read is added; anything else is computed from the new PDF the first
+        time it is asked for.
+
+        The recruiter index entry is built from the original's text with its
+        edited sections replaced by the submitted fields. Sections the new PDF
+        does not render (projects, certifications...) are dropped.
+
+        In async mode this runs in a job pool process. The document cache,
+        resume index and near-duplicate index are all shared through disk, so
+        serving processes see the results on their next read.
+        """
+        previous = self.document_cache.peek_artifact(
+            resume_path, 'resume_data', version=ARTIFACT_VERSIONS['resume_data']) or {}
+        changed = {field for fields in RENDERED_SECTIONS.values() for field in fields
+                   if previous.get(field) != resume_data.get(field)}
+        print(f"Resume fields changed: {sorted(changed) or 'none'}")
+
+        original = self._get_document(resume_path)
+        original_sections = {section.name for section in original.sections}
+        unchanged = {name for name, fields in RENDERED_SECTIONS.items()
+                     if name in original_sections and not changed.intersection(fields)}
+
+        def carries(names):
+            # The sections read in the original and in the new PDF must be the same
+            # (an extractor reads the whole text when none of its sections exist)
+            rendered_sections = set(RENDERED_SECTIONS)
+            if names is None:
+                before, after = original_sections, rendered_sections
+            else:
+                before = original_sections & set(names) or original_sections
+                after = rendered_sections & set(names) or rendered_sections
+            return before == after and after <= unchanged
+
+        digest = self.document_cache.file_hash(output_path)
+        self.document_cache.put_artifact(digest, 'resume_data', resume_data,
+                                         version=ARTIFACT_VERSIONS['resume_data'])
+        for name, sections in ARTIFACT_DEPENDENCIES.items():
+            version = ARTIFACT_VERSIONS.get(name)
+            value = self.document_cache.peek_artifact(resume_path, name, version=version)
+            if value is not None and carries(sections):
+                self.document_cache.put_artifact(digest, name, value, version=version)
+
+        analysis = self.get_cached_analysis(resume_path)
+        if analysis is not None and all(carries(sections) for sections in ANALYSIS_DEPENDENCIES.values()):
+            self._cache_analysis(output_path, analysis)
+
+        # Recruiter ranking should list the updated version in place of the old one
+        rendered = self._rendered_sections(resume_data)
+        parts = []
+        for name in RENDERED_SECTIONS:
+            kept = [original[section.start:section.end] for section in original.sections
+                    if section.name == name] if name in unchanged else []
+            parts.extend(kept or [rendered[name]])
+        # Kept sections end where the next heading starts, as in the original
+        text = ''.join(part if part.endswith('\n') else part + '\n' for part in parts)
+        self.resume_index.delete(self.document_cache.file_hash(resume_path))
+        self.resume_index.add(digest, text, self._extract_skills(text),
+                              path=os.path.abspath(output_path))
+
+    def _rendered_sections(self, resume_data):
+        """The text of each section update_resume renders, laid out as in the PDF."""
+        experience = [f"{exp['position']} at {exp['company']}\n"
+                      f"{exp['start_date']} - {exp['end_date']}\n{exp['description']}"
+                      for exp in resume_data['experience']]
+        education = [f"{edu['degree']} at {edu['institution']}\n"
+                     f"{edu['start_date']} - {edu['end_date']}"
+                     for edu in resume_data['education']]
+        return {
+            'header': f"{resume_data['name']}\n{resume_data['email']} | {resume_data['phone']}",
+            'summary': '\n'.join(['Professional Summary', resume_data['summary']]),
+            'skills': '\n'.join(['Skills', ', '.join(resume_data['skills'])]),
+            'experience': '\n'.join(['Experience'] + experience),
+            'education': '\n'.join(['Education'] + education)
+        }
+
     def create_portfolio(self, portfolio_data):
         """Create a portfolio website based on the provided data."""
         try:
@@ -431,6 +803,8 @@ class ResumeAnalyzer:
                 })
             
             return enhancements
+        except PdfParseError:
+            raise
         except Exception as e:
             raise Exception(f"Error generating enhancement suggestions: {str(e)}")
 
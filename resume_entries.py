@@ -0,0 +1,215 @@
+import re
+
+_MONTH = (r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+          r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)')
+_DATE = rf'(?:{_MONTH}\.?[ \t]+\d{{4}}|\d{{1,2}}/\d{{4}}|(?:19|20)\d{{2}})'
+_PRESENT = r'(?:present|current|now|today|ongoing)'
+
+# "Jan 2020 - Present", "03/2018 – 05/2021", "2016 to 2019", "(2019-2020)"
+DATE_RANGE_PATTERN = re.compile(
+    rf'\(?\b(?P<start>{_DATE})[ \t]*(?:-|–|—|to|until)[ \t]*(?P<end>{_DATE}|{_PRESENT})\b\)?',
+    re.IGNORECASE
+)
+SINGLE_DATE_PATTERN = re.compile(rf'\(?\b(?P<date>{_DATE}|{_PRESENT})\b\)?', re.IGNORECASE)
+
+# Separators between the parts of an entry header line
+_HEADER_SPLIT = re.compile(r'[ \t]+(?:at|@)[ \t]+|[ \t]*[|•·][ \t]*|[ \t]+[-–—][ \t]+|,[ \t]*', re.IGNORECASE)
+_BULLET = re.compile(r'^[ \t]*(?:[-*•●▪◦]|\d+[.)])[ \t]*')
+_EDGE_PUNCTUATION = ' \t,|-–—:;()'
+
+_TITLE_WORDS = re.compile(
+    r'\b(?:engineer|developer|programmer|manager|analyst|intern|designer|scientist|consultant'
+    r'|lead|director|architect|specialist|administrator|officer|associate|assistant'
+    r'|coordinator|head|president|founder|technician|researcher|teacher|accountant'
+    r'|representative|executive|supervisor|strategist|writer|editor|owner)s?\b',
+    re.IGNORECASE
+)
+_DEGREE_WORDS = re.compile(
+    r'\b(?:bachelor|master|doctor|doctorate|associate|diploma|certificate|b\.?sc?|m\.?sc?'
+    r'|b\.?a|m\.?a|b\.?eng|m\.?eng|b\.?tech|m\.?tech|mba|ph\.?d|high school diploma)\b\.?',
+    re.IGNORECASE
+)
+_INSTITUTION_WORDS = re.compile(
+    r'\b(?:university|college|institute|school|academy|polytechnic|conservatory)\b',
+    re.IGNORECASE
+)
+
+
+def _strip_dates(line, match):
+    return (line[:match.start()] + ' ' + line[match.end():]).strip(_EDGE_PUNCTUATION)
+
+
+def _header_parts(text):
+    # " at " means "position at company", so keep track of which side is which
+    at_match = re.search(r'[ \t]+(?:at|@)[ \t]+', text, re.IGNORECASE)
+    if at_match:
+        position = text[:at_match.start()].strip(_EDGE_PUNCTUATION)
+        company = _HEADER_SPLIT.split(text[at_match.end():])[0].strip(_EDGE_PUNCTUATION)
+        return [position, company]
+    return [part.strip(_EDGE_PUNCTUATION) for part in _HEADER_SPLIT.split(text)
+            if part.strip(_EDGE_PUNCTUATION)]
+
+
+def _position_and_company(parts):
+    """Order two header parts as (position, company) using job-title words."""
+    if len(parts) >= 2 and not _TITLE_WORDS.search(parts[0]) and _TITLE_WORDS.search(parts[1]):
+        return parts[1], parts[0]
+    return parts[0], parts[1] if len(parts) > 1 else ''
+
+
+def _has_title(parts):
+    return any(_TITLE_WORDS.search(part) for part in parts)
+
+
+def _title_part(parts):
+    return next((part for part in parts if _TITLE_WORDS.search(part)), parts[0])
+
+
+def _entry_header(parts, above):
+    """Position and company for a dated line, and how many lines above it they used.
+
+    ``parts`` are the header parts left on the dated line; ``above`` holds
+    up to two non-bullet lines just above it, nearest first. A title line
+    followed by a "Company, City, ST" line is read as position then company
+    rather than company then location.
+    """
+    first = _header_parts(above[0]) if above else []
+    second = _header_parts(above[1]) if len(above) > 1 else []
+    if len(parts) >= 2:
+        if not _has_title(parts) and _has_title(first):
+            # "Senior Engineer" above "Google, Mountain View, CA  2019 - Present"
+            return _title_part(first), parts[0], 1
+        return (*_position_and_company(parts), 0)
+    if parts:
+        if first:
+            return (*_position_and_company(first + parts), 1)
+        return (*_position_and_company(parts), 0)
+    if not first:
+        return '', '', 0
+    # Only the dates are on this line
+    if second and len(above[1].split()) <= 8 and _has_title(second) and not _has_title(first):
+        # "Senior Engineer" / "Google, Mountain View, CA" / "June 2019 - Present"
+        return _title_part(second), first[0], 2
+    if len(first) == 1 and second and len(above[1].split()) <= 8 and _has_title(second + first):
+        # "Google" / "Senior Engineer" / "2019 - 2021"
+        return (*_position_and_company(first + second[:1]), 2)
+    return (*_position_and_company(first), 1)
+
+
+def extract_experience_entries(text):
+    """Structured work history from the experience section of a resume.
+
+    Every line holding a date range starts an entry. Position and company
+    come from the rest of that line ("Engineer, Acme  2019 - 2021",
+    "Engineer at Acme (2019-2021)") or, when the line only names one of
+    them, from up to two lines just above it ("Engineer" / "Acme, Austin, TX"
+    / "2019 - 2021"). Following lines up to the next entry form the
+    description. Each line is matched once against precompiled
+    patterns, so the cost is linear in the length of the text.
+    """
+    entries = []
+    pending = []            # the last two lines, which may head the next entry
+
+    def add_description(line):
+        if entries:
+            entries[-1]['description_lines'].append(line)
+
+    for raw_line in text.split('\n'):
+        line = raw_line.strip()
+        if not line:
+            continue
+        match = DATE_RANGE_PATTERN.search(line)
+        if match is None:
+            if len(pending) == 2:
+                add_description(pending.pop(0))
+            pending.append(line)
+            continue
+
+        above = []
+        for candidate in reversed(pending):
+            if _BULLET.match(candidate):
+                break
+            above.append(candidate)
+        position, company, used = _entry_header(_header_parts(_strip_dates(line, match)), above)
+        for leftover in pending[:len(pending) - used]:
+            add_description(leftover)
+        pending = []
+
+        entries.append({
+            'position': position,
+            'company': company,
+            'start_date': match.group('start'),
+            'end_date': match.group('end'),
+            'description_lines': []
+        })
+
+    for leftover in pending:
+        add_description(leftover)
+
+    for entry in entries:
+        lines = entry.pop('description_lines')
+        entry['description'] = ' '.join(_BULLET.sub('', line) for line in lines)
+    return entries
+
+
+def extract_education_entries(text):
+    """Structured education entries (degree, institution, dates) in one pass.
+
+    A line naming a degree starts an entry; an institution on the same or
+    the next line completes it, and an institution line with no open entry
+    starts one of its own. Date ranges or a single graduation year on those
+    lines fill ``start_date``/``end_date``.
+    """
+    entries = []
+    for raw_line in text.split('\n'):
+        line = _BULLET.sub('', raw_line.strip())
+        if not line:
+            continue
+        current = entries[-1] if entries else None
+
+        date_range = DATE_RANGE_PATTERN.search(line)
+        single_date = None if date_range else SINGLE_DATE_PATTERN.search(line)
+        rest = line
+        if date_range:
+            rest = _strip_dates(line, date_range)
+        elif single_date:
+            rest = _strip_dates(line, single_date)
+
+        degree = institution = ''
+        others = []
+        for part in _header_parts(rest) or [rest]:
+            # "High School Diploma" names a degree, not a school
+            if not institution and _INSTITUTION_WORDS.search(_DEGREE_WORDS.sub(' ', part)):
+                institution = part
+            elif not degree and _DEGREE_WORDS.search(part):
+                degree = part
+            else:
+                others.append(part)
+        awaiting_degree = (current is not None and current['institution']
+                           and not current['degree'] and not current['end_date'])
+        if degree and not institution and awaiting_degree:
+            # "University of Oxford" then "PhD, Physics, 2020 - 2024"
+            current['degree'] = degree
+            degree = ''
+        elif degree and not institution and others:
+            # "MIT | MSc Artificial Intelligence": the other part is the school
+            institution = others[0]
+
+        # An institution completes the open entry unless that entry is already
+        # finished (has its own institution or dates)
+        entry_open = current is not None and not current['institution'] and not current['end_date']
+        if degree or (institution and not entry_open):
+            current = {'degree': degree, 'institution': institution,
+                       'start_date': '', 'end_date': ''}
+            entries.append(current)
+        elif institution and current is not None:
+            current['institution'] = institution
+        elif current is None or not (date_range or single_date or awaiting_degree):
+            continue
+
+        if date_range:
+            current['start_date'] = date_range.group('start')
+            current['end_date'] = date_range.group('end')
+        elif single_date and not current['end_date']:
+            current['end_date'] = single_date.group('date')
+    return entries
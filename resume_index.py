@@ -0,0 +1,307 @@
+import heapq
+import json
+import os
+import tempfile
+import threading
+import numpy as np
+from scipy import sparse
+from .similarity import HASHED_TERM_FEATURES, get_similarity_engine, hash_term_counts
+from .operation_log import OperationLog
+
+# Rewrite the snapshot once this many operations have been appended to the log
+COMPACT_AFTER_OPERATIONS = 500
+
+
+class ResumeIndex:
+    """Persistent index of resume term vectors and skill sets for ranking.
+
+    Each resume is stored once, keyed by its content hash, with its hashed
+    term counts and its extracted skills. ``rank`` weights the counts with
+    the similarity engine's IDF table (kept until the rows or the model
+    change), so scores are on the same scale as ``/analyze-match``, and
+    scores every candidate against a job description with sparse matrix
+    products (text similarity and skill overlap), pre-filtering through an inverted skill index when
+    required skills are given, and returns the top-k through a heap.
+
+    On disk the index is a snapshot (``snapshot.npz``, vectors and metadata)
+    plus an append-only ``operations.jsonl`` log of adds and deletes since
+    the snapshot, so single uploads never rewrite the whole index. Every
+    worker process keeps its own copy in memory and applies the log entries
+    other workers appended before each read (see ``OperationLog``).
+    """
+
+    def __init__(self, index_dir='data/resume_index', compact_after=COMPACT_AFTER_OPERATIONS,
+                 similarity_engine=None):
+        self.index_dir = index_dir
+        self.compact_after = compact_after
+        self._similarity_engine = similarity_engine
+        self._lock = threading.RLock()
+        self._resumes = []            # row -> {'id', 'path', 'skills'}
+        self._rows_by_id = {}         # resume id -> row
+        self._skill_postings = {}     # lowercase skill -> set of rows
+        self._vector_rows = []        # vectors added since the matrix was built
+        self._matrix = sparse.csr_matrix((0, HASHED_TERM_FEATURES), dtype=np.float64)
+        self._skill_columns = {}
+        self._skill_matrix = None
+        self._weighted = None         # (engine, TF-IDF matrix) for the current rows
+        os.makedirs(self.index_dir, exist_ok=True)
+        self._log = OperationLog(self._path('operations.jsonl'))
+        with self._lock, self._log.locked():
+            self._load_snapshot()
+            self._catch_up()
+
+    def __len__(self):
+        with self._lock:
+            self._sync()
+            return len(self._rows_by_id)
+
+    def __contains__(self, resume_id):
+        with self._lock:
+            self._sync()
+            return resume_id in self._rows_by_id
+
+    @property
+    def similarity_engine(self):
+        return self._similarity_engine or get_similarity_engine()
+
+    def paths(self):
+        with self._lock:
+            self._sync()
+            return [self._resumes[row]['path'] for row in self._rows_by_id.values()]
+
+    def add(self, resume_id, text, skills, path=None):
+        """Index a resume; re-adding an existing id replaces it."""
+        vector = hash_term_counts([text])
+        self._write({
+            'op': 'add',
+            'id': resume_id,
+            'path': path,
+            'skills': list(skills),
+            'indices': vector.indices.tolist(),
+            'data': vector.data.tolist()
+        })
+
+    def delete(self, resume_id):
+        with self._lock, self._log.locked(exclusive=True):
+            self._catch_up()
+            if resume_id not in self._rows_by_id:
+                return False
+            self._write({'op': 'delete', 'id': resume_id})
+            return True
+
+    def rank(self, job_description, job_skills, top_k=50, required_skills=None):
+        """Return the ``top_k`` best resumes for a job description.
+
+        Scores combine text similarity and the share of ``job_skills`` each
+        resume covers with the same weights as
+        ``ResumeAnalyzer.calculate_match_score``. ``job_description`` may be
+        the text or its precomputed hashed term counts.
+        """
+        if isinstance(job_description, str):
+            job_description = hash_term_counts([job_description])
+        engine = self.similarity_engine
+        query = engine.weight(job_description)
+        job_skills = list(dict.fromkeys(job_skills))
+
+        with self._lock:
+            self._sync()
+            matrix = self._get_weighted_matrix(engine)
+            candidates = self._candidate_rows(required_skills)
+            if candidates is None or len(candidates) == 0:
+                return []
+
+            # Slicing rows copies them, so only slice when the filter is selective
+            if len(candidates) * 4 < matrix.shape[0]:
+                similarity = matrix[candidates].dot(query.T).toarray().ravel()
+            else:
+                similarity = matrix.dot(query.T).toarray().ravel()[candidates]
+
+            if job_skills:
+                skill_matrix = self._get_skill_matrix()
+                job_vector = np.zeros(skill_matrix.shape[1])
+                for skill in job_skills:
+                    column = self._skill_columns.get(skill.lower())
+                    if column is not None:
+                        job_vector[column] = 1
+                overlap = skill_matrix.dot(job_vector)[candidates]
+                skill_match = overlap / len(job_skills)
+            else:
+                skill_match = np.zeros(len(candidates))
+
+            overall = 0.7 * similarity + 0.3 * skill_match
+            best = heapq.nlargest(top_k, range(len(candidates)), key=overall.__getitem__)
+
+            job_skill_set = set(job_skills)
+            results = []
+            for position in best:
+                resume = self._resumes[candidates[position]]
+                resume_skills = set(resume['skills'])
+                results.append({
+                    'resume_id': resume['id'],
+                    'resume_path': resume['path'],
+                    'overall_score': round(float(overall[position]) * 100, 2),
+                    'similarity_score': round(float(similarity[position]) * 100, 2),
+                    'skill_match_score': round(float(skill_match[position]) * 100, 2),
+                    'matching_skills': list(resume_skills & job_skill_set),
+                    'missing_skills': list(job_skill_set - resume_skills)
+                })
+            return results
+
+    def _candidate_rows(self, required_skills):
+        """Rows that have every required skill, via the inverted index."""
+        if required_skills:
+            postings = [self._skill_postings.get(skill.lower(), set()) for skill in required_skills]
+            postings.sort(key=len)
+            rows = set(postings[0])
+            for posting in postings[1:]:
+                rows &= posting
+                if not rows:
+                    break
+        else:
+            rows = set(self._rows_by_id.values())
+        return np.fromiter(sorted(rows), dtype=np.int64, count=len(rows))
+
+    def _append(self, resume_id, vector, skills, path):
+        # ``vector`` is None when the row is already part of the loaded matrix
+        row = len(self._resumes)
+        self._resumes.append({'id': resume_id, 'path': path, 'skills': skills})
+        self._rows_by_id[resume_id] = row
+        if vector is not None:
+            self._vector_rows.append(vector)
+        for skill in skills:
+            self._skill_postings.setdefault(skill.lower(), set()).add(row)
+        self._skill_matrix = None
+
+    def _remove(self, resume_id):
+        row = self._rows_by_id.pop(resume_id)
+        for skill in self._resumes[row]['skills']:
+            self._skill_postings.get(skill.lower(), set()).discard(row)
+        self._skill_matrix = None
+
+    def _get_matrix(self):
+        if self._vector_rows:
+            self._matrix = sparse.vstack([self._matrix] + self._vector_rows, format='csr')
+            self._vector_rows = []
+            self._weighted = None
+        return self._matrix
+
+    def _get_weighted_matrix(self, engine):
+        matrix = self._get_matrix()
+        if self._weighted is None or self._weighted[0] is not engine:
+            self._weighted = (engine, engine.weight(matrix))
+        return self._weighted[1]
+
+    def term_matrix(self):
+        """Hashed term counts of every indexed resume, one row each."""
+        with self._lock:
+            self._sync()
+            live_rows = sorted(self._rows_by_id.values())
+            return self._get_matrix()[live_rows]
+
+    def _get_skill_matrix(self):
+        """Resume x skill incidence matrix, rebuilt after additions."""
+        if self._skill_matrix is None:
+            self._skill_columns = {skill: i for i, skill in enumerate(sorted(self._skill_postings))}
+            rows, columns = [], []
+            for skill, posting in self._skill_postings.items():
+                column = self._skill_columns[skill]
+                rows.extend(posting)
+                columns.extend([column] * len(posting))
+            self._skill_matrix = sparse.csr_matrix(
+                (np.ones(len(rows)), (rows, columns)),
+                shape=(len(self._resumes), len(self._skill_columns))
+            )
+        return self._skill_matrix
+
+    # Persistence
+
+    def _path(self, name):
+        return os.path.join(self.index_dir, name)
+
+    def _reset(self, matrix=None, resumes=()):
+        self._resumes, self._rows_by_id = [], {}
+        self._skill_postings, self._vector_rows = {}, []
+        self._skill_matrix = None
+        self._weighted = None
+        self._matrix = matrix if matrix is not None else sparse.csr_matrix(
+            (0, HASHED_TERM_FEATURES), dtype=np.float64)
+        for resume in resumes:
+            self._append(resume['id'], None, resume['skills'], resume['path'])
+
+    def _load_snapshot(self):
+        snapshot_path = self._path('snapshot.npz')
+        if not os.path.exists(snapshot_path):
+            self._reset()
+            return
+        with np.load(snapshot_path) as snapshot:
+            matrix = sparse.csr_matrix(
+                (snapshot['data'], snapshot['indices'], snapshot['indptr']),
+                shape=tuple(snapshot['shape'])
+            )
+            resumes = json.loads(str(snapshot['resumes']))
+        self._reset(matrix, resumes)
+
+    def _catch_up(self):
+        """Apply operations other processes logged since the last call."""
+        reset, operations = self._log.read_new()
+        if reset:
+            self._load_snapshot()
+        for operation in operations:
+            self._replay(operation)
+
+    def _sync(self):
+        with self._log.locked():
+            self._catch_up()
+
+    def _replay(self, operation):
+        resume_id = operation['id']
+        if resume_id in self._rows_by_id:
+            self._remove(resume_id)
+        if operation['op'] == 'add':
+            vector = sparse.csr_matrix(
+                (operation['data'], operation['indices'], [0, len(operation['indices'])]),
+                shape=(1, HASHED_TERM_FEATURES)
+            )
+            self._append(resume_id, vector, operation['skills'], operation['path'])
+
+    def _write(self, operation):
+        """Apply an operation locally and log it, after catching up with other processes."""
+        with self._lock, self._log.locked(exclusive=True):
+            self._catch_up()
+            self._replay(operation)
+            self._log.append(operation)
+            if self._log.operations >= self.compact_after:
+                self._compact()
+
+    def compact(self):
+        """Drop deleted rows and rewrite the snapshot, starting a new log."""
+        with self._lock, self._log.locked(exclusive=True):
+            self._catch_up()
+            self._compact()
+
+    def _compact(self):
+        # Caught up under the exclusive lock, so local state is the merged log
+        # of every process and nothing can be appended until the log rotates
+        matrix = self._get_matrix()
+        live_rows = sorted(self._rows_by_id.values())
+        resumes = [self._resumes[row] for row in live_rows]
+        matrix = matrix[live_rows] if live_rows else matrix[:0]
+
+        # One file replaced atomically, so vectors and metadata always agree.
+        # Replaying a log that survived a crash here is harmless because
+        # adds replace and deletes are idempotent.
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_dir, suffix='.npz')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(
+                f,
+                data=matrix.data,
+                indices=matrix.indices,
+                indptr=matrix.indptr,
+                shape=np.array(matrix.shape),
+                resumes=np.array(json.dumps(resumes))
+            )
+        os.replace(tmp_path, self._path('snapshot.npz'))
+        self._log.rotate()
+
+        # Rebuild the in-memory state without tombstones
+        self._reset(matrix, resumes)
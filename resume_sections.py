@@ -0,0 +1,68 @@
+import hashlib
+import re
+from collections import namedtuple
+
+# Heading lines that start a resume section, by section name
+SECTION_HEADINGS = {
+    'summary': ('summary', 'professional summary', 'career summary', 'profile',
+                'professional profile', 'objective', 'career objective', 'about me'),
+    'experience': ('experience', 'work experience', 'professional experience',
+                   'relevant experience', 'employment', 'employment history',
+                   'work history', 'career history'),
+    'education': ('education', 'education and training', 'academic background',
+                  'academic qualifications', 'qualifications'),
+    'skills': ('skills', 'technical skills', 'core skills', 'key skills',
+               'core competencies', 'competencies', 'technologies', 'tools'),
+    'projects': ('projects', 'personal projects', 'selected projects', 'key projects'),
+    'certifications': ('certifications', 'certificates', 'licenses',
+                       'licenses and certifications', 'certifications and licenses'),
+    'awards': ('awards', 'honors', 'honors and awards', 'achievements'),
+    'publications': ('publications',),
+    'languages': ('languages',),
+    'interests': ('interests', 'hobbies', 'hobbies and interests')
+}
+_HEADING_LOOKUP = {heading: section for section, headings in SECTION_HEADINGS.items()
+                   for heading in headings}
+
+# A heading is a whole line holding one known heading, in any casing, with
+# optional decoration ("## Skills", "WORK EXPERIENCE:", "— Education —").
+# Longest alternatives first so "work experience" wins over "experience".
+_HEADING_PATTERN = re.compile(
+    r'^[ \t]*[#=*_\-–—•|]*[ \t]*('
+    + '|'.join(r'[ \t]+'.join(re.escape(word) for word in heading.split())
+               for heading in sorted(_HEADING_LOOKUP, key=len, reverse=True))
+    + r')[ \t]*[:#=*_\-–—|]*[ \t]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# ``start``/``end`` delimit the whole section in the text, heading included;
+# ``body_start`` is where the text after the heading line begins
+Section = namedtuple('Section', ['name', 'start', 'end', 'body_start'])
+
+
+def segment_sections(text):
+    """Find every section of a resume in one pass over ``text``.
+
+    Returns ``Section`` offsets in document order. Text before the first
+    recognised heading is the ``header`` section (name and contact details).
+    A section name repeats if its heading does.
+    """
+    sections = []
+    name, start, body_start = 'header', 0, 0
+    for match in _HEADING_PATTERN.finditer(text):
+        sections.append(Section(name, start, match.start(), body_start))
+        name = _HEADING_LOOKUP[' '.join(match.group(1).lower().split())]
+        start, body_start = match.start(), min(match.end() + 1, len(text))
+    sections.append(Section(name, start, len(text), body_start))
+    return [section for section in sections if text[section.start:section.end].strip()]
+
+
+def section_text(text, sections, names, body_only=False):
+    """Join the text of every section named in ``names``, or None if there are none."""
+    slices = [text[section.body_start if body_only else section.start:section.end]
+              for section in sections if section.name in names]
+    return '\n'.join(slices) if slices else None
+
+
+def section_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
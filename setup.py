@@ -16,6 +16,18 @@ def download_nltk_data():
         print(f"Error downloading NLTK data: {e}")
         sys.exit(1)
 
+def compile_questions():
+    print("Compiling interview question bank...")
+    try:
+        from modules.question_bank import compile_question_bank
+        from modules.interview import InterviewSystem
+        compile_question_bank()
+        # Grade every quiz option now so answering a quiz needs no NLP work
+        InterviewSystem().build_grading_table()
+    except Exception as e:
+        print(f"Error compiling interview question bank: {e}")
+        sys.exit(1)
+
 def install_requirements():
     print("Installing required packages...")
     try:
@@ -29,4 +41,5 @@ if __name__ == "__main__":
     print("Setting up CareerPro AI...")
     install_requirements()
     download_nltk_data()
+    compile_questions()
     print("Setup completed successfully!") 
\ No newline at end of file
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import threading
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+
+SIMILARITY_MODEL_DIR = 'data/similarity_model'
+
+# Stateless term features: the same text always maps to the same counts, so
+# stored vectors stay comparable as documents are added and as the IDF table
+# is refitted. Tokens are those of ``TfidfVectorizer(stop_words='english')``.
+HASHED_TERM_FEATURES = 2 ** 18
+_hashing_vectorizer = HashingVectorizer(
+    n_features=HASHED_TERM_FEATURES,
+    alternate_sign=False,
+    stop_words='english',
+    norm=None
+)
+
+
+def hash_term_counts(texts):
+    """Return hashed term counts (one CSR row per text)."""
+    return _hashing_vectorizer.transform(list(texts))
+
+
+class SimilarityEngine:
+    """TF-IDF cosine similarity over hashed term features.
+
+    The fitted model is one NumPy array, the IDF weight of every hashed
+    feature, saved as ``idf.npy`` and memory-mapped on load so serving
+    processes share one copy. An engine without a fitted table weights every
+    term equally, which is plain term-frequency cosine.
+
+    Every similarity in the app goes through ``weight``: the pairwise APIs
+    here, and the resume index and job store, which keep raw hashed counts
+    and weight them with the current engine when they score. A pair scores
+    identically whichever path is used.
+    """
+
+    def __init__(self, idf=None):
+        self.idf = idf
+
+    @classmethod
+    def fit(cls, counts):
+        """Fit IDF weights over hashed term counts (see ``hash_term_counts``)."""
+        counts = sparse.csr_matrix(counts)
+        documents = counts.shape[0]
+        document_frequency = np.bincount(
+            counts.indices[counts.data > 0], minlength=HASHED_TERM_FEATURES
+        )
+        # Smoothed as in TfidfVectorizer; terms never seen get the highest weight
+        idf = np.log((1 + documents) / (1 + document_frequency)) + 1
+        return cls(idf.astype(np.float64))
+
+    @classmethod
+    def load(cls, model_dir):
+        idf = np.load(os.path.join(model_dir, 'idf.npy'), mmap_mode='r')
+        if idf.shape != (HASHED_TERM_FEATURES,):
+            raise ValueError(f"Similarity model in {model_dir} does not match the term features")
+        return cls(idf)
+
+    def save(self, model_dir):
+        os.makedirs(model_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=model_dir, suffix='.npy')
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, np.asarray(self.idf))
+        os.replace(tmp_path, os.path.join(model_dir, 'idf.npy'))
+
+    def weight(self, counts):
+        """L2-normalized TF-IDF rows from hashed term counts."""
+        matrix = sparse.csr_matrix(counts, dtype=np.float64)
+        if self.idf is not None:
+            matrix = matrix.multiply(np.asarray(self.idf)).tocsr()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return sparse.csr_matrix(sparse.diags(1 / norms).dot(matrix))
+
+    def transform(self, texts):
+        """Return L2-normalized TF-IDF vectors (one CSR row per text)."""
+        return self.weight(hash_term_counts(texts))
+
+    def similarity(self, first, second):
+        return float(self.many_vs_many([first], [second])[0, 0])
+
+    def one_vs_many(self, query, documents):
+        if not documents:
+            return []
+        return [float(score) for score in self.many_vs_many([query], documents)[0]]
+
+    def many_vs_many(self, queries, documents):
+        """Cosine similarity matrix of shape (len(queries), len(documents))."""
+        queries, documents = list(queries), list(documents)
+        if not queries or not documents:
+            return np.zeros((len(queries), len(documents)))
+        return self.transform(queries).dot(self.transform(documents).T).toarray()
+
+
+_unweighted_engine = SimilarityEngine()
+_shared_engine = None
+_shared_engine_signature = None     # stat of idf.npy when it was loaded
+_shared_engine_lock = threading.Lock()
+
+
+def _model_signature(model_dir):
+    try:
+        stat = os.stat(os.path.join(model_dir, 'idf.npy'))
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def get_similarity_engine(model_dir=SIMILARITY_MODEL_DIR):
+    """Return the engine for the saved model, memory-mapping it once per version.
+
+    A model rebuilt by another process is picked up on the next call. Until
+    a model exists this is an engine that weights every term equally.
+    """
+    global _shared_engine, _shared_engine_signature
+    signature = _model_signature(model_dir)
+    if signature is None:
+        return _unweighted_engine
+    if signature != _shared_engine_signature:
+        with _shared_engine_lock:
+            if signature != _shared_engine_signature:
+                try:
+                    _shared_engine = SimilarityEngine.load(model_dir)
+                except ValueError as e:
+                    # A model saved by older code; rebuild it to use IDF again
+                    print(f"Ignoring similarity model: {e}")
+                    _shared_engine = _unweighted_engine
+                _shared_engine_signature = signature
+    return _shared_engine
+
+
+def has_similarity_model(model_dir=SIMILARITY_MODEL_DIR):
+    return _model_signature(model_dir) is not None
+
+
+def build_similarity_model(counts, model_dir=SIMILARITY_MODEL_DIR):
+    """Fit the IDF table over hashed term counts and save it."""
+    SimilarityEngine.fit(counts).save(model_dir)
+    return get_similarity_engine(model_dir)
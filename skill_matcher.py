@@ -0,0 +1,155 @@
+import json
+import os
+import threading
+from collections import deque
+
+DEFAULT_TAXONOMY_PATH = 'data/skills_taxonomy.json'
+
+# Used when no taxonomy file is available
+DEFAULT_SKILLS = [
+    "Python", "Java", "JavaScript", "SQL", "AWS", "Azure", "Docker", "Kubernetes",
+    "React", "Angular", "Vue", "Machine Learning", "Data Analysis", "Project Management"
+]
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton that finds many phrases in a single pass.
+
+    Matching is case-insensitive, treats any run of whitespace as a single
+    space (so "machine  learning" or a line break inside a phrase still
+    matches) and only reports matches that start and end on a word boundary, i.e. the
+    characters on either side of the match are not letters or digits. Each
+    phrase carries a payload that is returned with its matches.
+    """
+
+    def __init__(self, phrases):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for phrase, payload in phrases:
+            self._add(phrase, payload)
+        self._build()
+
+    def _add(self, phrase, payload):
+        phrase = ' '.join(phrase.lower().split())
+        if not phrase:
+            return
+        state = 0
+        for ch in phrase:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(phrase), payload))
+
+    def _build(self):
+        """Compute failure links breadth-first and merge suffix outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def iter_matches(self, text):
+        """Yield ``(start, end, payload)`` for every word-bounded match in text.
+
+        Offsets index into ``text`` itself, even where lowercasing a character
+        yields more than one ('İ' -> 'i̇').
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        last = len(text) - 1
+        state = 0
+        positions = []      # index in text of every character fed to the automaton
+        for i, original in enumerate(text):
+            if original.isspace():
+                if positions and text[positions[-1]].isspace():
+                    continue
+                lowered = ' '
+            else:
+                lowered = original.lower()
+            for ch in lowered:
+                positions.append(i)
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+            if i < last and text[i + 1].isalnum():
+                continue
+            for length, payload in output[state]:
+                start = positions[len(positions) - length]
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                yield start, i + 1, payload
+
+
+class SkillMatcher:
+    """Finds taxonomy skills (and their synonyms) in text in one pass."""
+
+    def __init__(self, taxonomy):
+        # taxonomy maps each canonical skill name to a list of synonyms
+        self.skills = list(taxonomy)
+        self._order = {skill: i for i, skill in enumerate(self.skills)}
+        self._canonical = {}
+        phrases = []
+        for skill, synonyms in taxonomy.items():
+            for phrase in [skill] + list(synonyms or []):
+                phrases.append((phrase, skill))
+                self._canonical.setdefault(' '.join(phrase.lower().split()), skill)
+        self._matcher = PhraseMatcher(phrases)
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_TAXONOMY_PATH):
+        """Build a matcher from a JSON taxonomy file, or the default skills."""
+        return cls(load_skill_taxonomy(path))
+
+    def find_skills(self, text):
+        """Return canonical skills mentioned in text, in taxonomy order."""
+        found = {skill for _, _, skill in self._matcher.iter_matches(text)}
+        return sorted(found, key=self._order.__getitem__)
+
+    def canonicalize(self, skill):
+        """Map a skill name or synonym to its canonical name."""
+        return self._canonical.get(' '.join(skill.lower().split()), skill)
+
+
+def load_skill_taxonomy(path=DEFAULT_TAXONOMY_PATH):
+    """Load a ``{skill: [synonyms]}`` taxonomy from JSON."""
+    if not os.path.exists(path):
+        print(f"Skills taxonomy not found at {path}, using default skills.")
+        return {skill: [] for skill in DEFAULT_SKILLS}
+
+    with open(path, 'r') as f:
+        taxonomy = json.load(f)
+
+    # A plain list of skill names is accepted as a taxonomy without synonyms
+    if isinstance(taxonomy, list):
+        return {skill: [] for skill in taxonomy}
+    return taxonomy
+
+
+_shared_matcher = None
+_shared_matcher_lock = threading.Lock()
+
+
+def get_skill_matcher():
+    """Return the process-wide SkillMatcher, building it on first use."""
+    global _shared_matcher
+    if _shared_matcher is None:
+        with _shared_matcher_lock:
+            if _shared_matcher is None:
+                _shared_matcher = SkillMatcher.from_file()
+    return _shared_matcher
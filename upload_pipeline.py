@@ -0,0 +1,262 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .cache import LRUCache
+
+# Longest an endpoint waits on a running stage before computing it itself
+PIPELINE_WAIT_SECONDS = 60
+PIPELINE_WORKERS = 2
+MAX_TRACKED_UPLOADS = 256
+# Run records on disk are dropped once this old
+PIPELINE_RUN_TTL_SECONDS = 60 * 60
+# How often a process waiting on another worker's run re-reads its record
+PIPELINE_POLL_INTERVAL_SECONDS = 0.1
+
+PIPELINE_STAGES = ('header', 'text', 'near_duplicates', 'resume_data', 'skills', 'keywords',
+                   'analysis', 'enhancements', 'index')
+
+# The stages whose results each stage reads
+STAGE_INPUTS = {
+    'header': (),
+    'text': (),
+    'near_duplicates': ('text',),
+    'resume_data': ('text',),
+    'skills': ('text',),
+    'keywords': ('text',),
+    'analysis': ('text', 'skills', 'keywords'),
+    'enhancements': ('resume_data',),
+    'index': ('text', 'skills')
+}
+
+
+def _stage_with_inputs(stage):
+    """``stage`` and every stage it reads, directly or indirectly."""
+    stages = {stage}
+    for name in STAGE_INPUTS[stage]:
+        stages |= _stage_with_inputs(name)
+    return stages
+
+
+class UploadPipeline:
+    """Warms a resume's caches in the background as soon as it is uploaded.
+
+    ``submit`` runs every stage in a small thread pool so the results land in
+    the shared document and analysis caches. Endpoints call
+    ``wait_for(path, stage)`` first: stages it needs that are running are
+    waited on, and those not started yet are taken over and run by the
+    endpoint, so each stage is computed once and the endpoint then reads
+    the warm cache.
+
+    Each run's state is written to ``runs_dir`` on every stage change, so any
+    worker process can wait on or report a run another worker started. Each
+    upload records per-stage timings. The first stage reads only the first
+    page, so the run reports the resume's name and summary while the rest of
+    the document is still being parsed.
+    """
+
+    def __init__(self, resume_analyzer, max_workers=PIPELINE_WORKERS, runs_dir='data/upload_runs'):
+        self.resume_analyzer = resume_analyzer
+        self.runs_dir = runs_dir
+        os.makedirs(self.runs_dir, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='upload-pipeline')
+        self._runs = LRUCache(max_entries=MAX_TRACKED_UPLOADS)
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._stage_totals = {stage: [0, 0.0] for stage in PIPELINE_STAGES}
+        self._last_sweep = 0.0
+
+    def submit(self, resume_path):
+        """Start warming ``resume_path`` unless a run for its contents exists."""
+        digest = self.resume_analyzer.document_cache.file_hash(resume_path)
+        self._sweep()
+        with self._lock:
+            run = self._runs.get(digest)
+            if run is not None and run['status'] != 'failed':
+                return self._snapshot(run)
+            run = {
+                'digest': digest,
+                'resume_path': resume_path,
+                'status': 'queued',
+                'stages': {stage: {'status': 'pending', 'seconds': None} for stage in PIPELINE_STAGES},
+                'error': None,
+                'header': None,
+                'near_duplicate_of': None,
+                'submitted_at': time.time(),
+                'finished_at': None,
+                'events': {stage: threading.Event() for stage in PIPELINE_STAGES}
+            }
+            self._runs.put(digest, run)
+            self._save(run)
+        self._executor.submit(self._run, run)
+        return self._snapshot(run)
+
+    def wait_for(self, resume_path, stage, timeout=PIPELINE_WAIT_SECONDS):
+        """Make sure ``stage`` and the stages it reads have run for this resume.
+
+        Stages of a run in this process that have not started yet are run
+        right here, in the caller's thread, and the pipeline skips them when
+        it gets to them; stages already running are waited on. A run started
+        by another worker process is followed on disk until those stages
+        finish. Returns immediately when the resume was never submitted, and
+        gives up after ``timeout`` seconds, leaving the rest to the caller.
+        """
+        try:
+            digest = self.resume_analyzer.document_cache.file_hash(resume_path)
+        except OSError:
+            return
+        deadline = time.monotonic() + timeout
+        stages = _stage_with_inputs(stage)
+        run = self._runs.get(digest)
+        if run is not None:
+            # Pipeline order runs every input before the stages that read it
+            for name in PIPELINE_STAGES:
+                if name not in stages:
+                    continue
+                if self._claim(run, name):
+                    self._run_stage(run, name)
+                elif not run['events'][name].wait(max(0.0, deadline - time.monotonic())):
+                    return
+            return
+
+        # Started by another worker process: follow its record on disk
+        while time.monotonic() < deadline:
+            record = self._load(digest)
+            if record is None or record['status'] in ('done', 'failed') or not any(
+                    record['stages'][name]['status'] in ('pending', 'running') for name in stages):
+                return
+            time.sleep(PIPELINE_POLL_INTERVAL_SECONDS)
+
+    def status(self, resume_path):
+        digest = self.resume_analyzer.document_cache.file_hash(resume_path)
+        run = self._runs.get(digest)
+        return self._snapshot(run) if run else self._load(digest)
+
+    def stats(self):
+        """Return how often each stage ran and its mean duration."""
+        with self._lock:
+            return {
+                stage: {
+                    'runs': count,
+                    'mean_seconds': round(total / count, 4) if count else None
+                }
+                for stage, (count, total) in self._stage_totals.items()
+            }
+
+    def _stage_functions(self, run):
+        analyzer = self.resume_analyzer
+        path = run['resume_path']
+
+        def read_header():
+            run['header'] = analyzer.extract_resume_header(path)
+
+        def find_near_duplicate():
+            # Sections shared with the earlier upload hit the section cache below
+            run['near_duplicate_of'] = analyzer.find_near_duplicate(path)
+
+        return {
+            'header': read_header,
+            'text': lambda: analyzer._get_document(path),
+            'near_duplicates': find_near_duplicate,
+            'resume_data': lambda: analyzer.extract_resume_data(path),
+            'skills': lambda: analyzer._get_resume_skills(path, analyzer._get_document(path)),
+            'keywords': lambda: analyzer.get_keywords(path),
+            'analysis': lambda: analyzer.analyze(path),
+            'enhancements': lambda: analyzer.get_enhancement_suggestions(path),
+            'index': lambda: analyzer.index_resume(path)
+        }
+
+    def _claim(self, run, stage):
+        """Mark a pending stage as running; False if it has already been started."""
+        with self._lock:
+            state = run['stages'][stage]
+            if state['status'] != 'pending':
+                return False
+            state['status'] = 'running'
+            return True
+
+    def _run(self, run):
+        run['status'] = 'running'
+        for stage in PIPELINE_STAGES:
+            if self._claim(run, stage):
+                self._run_stage(run, stage)
+            else:
+                # An endpoint needed it first and is computing it now
+                run['events'][stage].wait()
+
+        run['status'] = 'failed' if run['error'] is not None else 'done'
+        run['finished_at'] = time.time()
+        self._save(run)
+
+    def _run_stage(self, run, stage):
+        """Run one claimed stage, in the pipeline or in a waiting endpoint's thread."""
+        state = run['stages'][stage]
+        if any(run['stages'][name]['status'] in ('failed', 'skipped')
+               for name in STAGE_INPUTS[stage]):
+            # An input is missing; waiters compute what they need themselves
+            state['status'] = 'skipped'
+            run['events'][stage].set()
+            self._save(run)
+            return
+
+        self._save(run)
+        started = time.perf_counter()
+        try:
+            self._stage_functions(run)[stage]()
+            state['status'] = 'done'
+        except Exception as e:
+            print(f"Upload pipeline stage {stage} failed for {run['resume_path']}: {e}")
+            state['status'] = 'failed'
+            run['error'] = e.to_dict() if hasattr(e, 'to_dict') else {'error': str(e)}
+        finally:
+            elapsed = time.perf_counter() - started
+            state['seconds'] = round(elapsed, 4)
+            run['events'][stage].set()
+        with self._lock:
+            self._stage_totals[stage][0] += 1
+            self._stage_totals[stage][1] += elapsed
+        self._save(run)
+
+    def _path(self, digest):
+        return os.path.join(self.runs_dir, f"{digest}.json")
+
+    def _save(self, run):
+        # Replaced atomically so other processes never read a partial record;
+        # serialized so an older snapshot never replaces a newer one
+        with self._save_lock:
+            fd, tmp_path = tempfile.mkstemp(dir=self.runs_dir, suffix='.json')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._snapshot(run), f)
+            os.replace(tmp_path, self._path(run['digest']))
+
+    def _load(self, digest):
+        try:
+            with open(self._path(digest), 'r') as f:
+                record = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if record['submitted_at'] < time.time() - PIPELINE_RUN_TTL_SECONDS:
+            return None
+        return record
+
+    def _sweep(self):
+        """Delete run records past their TTL, at most once a minute."""
+        now = time.time()
+        if now - self._last_sweep < 60:
+            return
+        self._last_sweep = now
+        cutoff = now - PIPELINE_RUN_TTL_SECONDS
+        for entry in os.scandir(self.runs_dir):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def _snapshot(self, run):
+        snapshot = {key: value for key, value in run.items() if key != 'events'}
+        snapshot['stages'] = {stage: dict(state) for stage, state in run['stages'].items()}
+        return snapshot
@@ -0,0 +1,82 @@
+import hashlib
+import os
+import tempfile
+
+PDF_MAGIC = b'%PDF-'
+
+
+class UploadRejected(Exception):
+    """Raised when an upload's contents do not match the expected file type."""
+
+
+class HashingUploadFile:
+    """Writable upload target that hashes and validates bytes as they arrive.
+
+    Werkzeug writes each multipart chunk here while parsing the request, so
+    the file goes straight to a temporary file in ``upload_dir`` without
+    being buffered in memory. The SHA-256 is updated per chunk, and once the
+    first bytes are in they are checked against ``magic``: a mismatch stops
+    anything further from being written. ``store`` then moves the file to
+    its content-addressed name.
+    """
+
+    def __init__(self, upload_dir, magic=PDF_MAGIC):
+        os.makedirs(upload_dir, exist_ok=True)
+        self.upload_dir = upload_dir
+        self.magic = magic
+        self.rejected = False
+        self.size = 0
+        self._header = b''
+        self._sha256 = hashlib.sha256()
+        fd, self._tmp_path = tempfile.mkstemp(dir=upload_dir, suffix='.part')
+        self._file = os.fdopen(fd, 'wb+')
+
+    def write(self, data):
+        if self.rejected:
+            return len(data)
+        if len(self._header) < len(self.magic):
+            self._header += data[:len(self.magic) - len(self._header)]
+            if not self.magic.startswith(self._header[:len(self.magic)]):
+                self.rejected = True
+                self._file.truncate(0)
+                return len(data)
+        self._sha256.update(data)
+        self.size += len(data)
+        return self._file.write(data)
+
+    def __getattr__(self, name):
+        # read/seek/tell/close etc. go to the temporary file
+        return getattr(self._file, name)
+
+    @property
+    def hexdigest(self):
+        return self._sha256.hexdigest()
+
+    def store(self, extension='.pdf'):
+        """Move the upload to ``<sha256><extension>``.
+
+        Returns ``(path, digest, duplicate)``; ``duplicate`` is True when
+        identical contents were already stored, in which case the new copy
+        is discarded.
+        """
+        if self.rejected or len(self._header) < len(self.magic):
+            self.discard()
+            raise UploadRejected("File contents are not a PDF")
+
+        self._file.close()
+        digest = self.hexdigest
+        path = os.path.join(self.upload_dir, f"{digest}{extension}")
+        if os.path.exists(path):
+            os.remove(self._tmp_path)
+            return path, digest, True
+        os.replace(self._tmp_path, path)
+        return path, digest, False
+
+    def discard(self):
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    # Werkzeug closes request files at teardown; an upload that was never
+    # stored is removed then
+    close = discard